@@ -1,8 +1,10 @@
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from src.interface import employee_router, position_router, auth_router
-from src.interface.dependencies import get_database
+from src.interface.dependencies import USE_POSTGRES, get_database
 
 
 @asynccontextmanager
@@ -12,7 +14,8 @@ async def lifespan(app: FastAPI):
     db = await get_database()
     await db.initialize()
     yield
-    # Shutdown (if needed)
+    # Shutdown
+    await db.close()
 
 
 app = FastAPI(
@@ -20,9 +23,13 @@ app = FastAPI(
     description="A RESTful API for employee management using Clean Architecture",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
+# CORSMiddleware is a pure ASGI middleware. Write any new middleware the same
+# way (an ``async def __call__(self, scope, receive, send)`` wrapper) rather
+# than subclassing BaseHTTPMiddleware, which adds a streaming layer per request.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, specify actual origins
@@ -53,6 +60,27 @@ async def health_check():
     }
 
 
+def default_workers() -> int:
+    """Worker processes to run when WEB_CONCURRENCY isn't set
+
+    One per CPU on PostgreSQL. SQLite allows a single writer, so extra
+    processes only queue on its file lock, and every worker would keep its
+    own position cache; it gets a single worker.
+    """
+    if USE_POSTGRES:
+        return os.cpu_count() or 1
+    return 1
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop and httptools ship with uvicorn[standard]. Workers need the app as
+    # an import string; each one gets its own connection and caches.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", default_workers())),
+    )
\ No newline at end of file
@@ -3,9 +3,11 @@ from .dtos import (
     EmployeeCreateDTO,
     EmployeeUpdateDTO,
     EmployeeResponseDTO,
+    EmployeeResponseListAdapter,
     PositionCreateDTO,
     PositionUpdateDTO,
     PositionResponseDTO,
+    PositionResponseAdapter,
     LoginDTO,
     TokenResponseDTO,
     UserCreateDTO,
@@ -20,9 +22,11 @@ __all__ = [
     "EmployeeCreateDTO",
     "EmployeeUpdateDTO",
     "EmployeeResponseDTO",
+    "EmployeeResponseListAdapter",
     "PositionCreateDTO",
     "PositionUpdateDTO",
     "PositionResponseDTO",
+    "PositionResponseAdapter",
     "LoginDTO",
     "TokenResponseDTO",
     "UserCreateDTO",
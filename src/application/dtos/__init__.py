@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 
 
 class EmployeeCreateDTO(BaseModel):
@@ -23,6 +23,10 @@ class EmployeeResponseDTO(BaseModel):
     position_name: Optional[str] = None
 
 
+# Built once at import; validates/serializes whole lists in pydantic-core
+EmployeeResponseListAdapter = TypeAdapter(List[EmployeeResponseDTO])
+
+
 class PositionCreateDTO(BaseModel):
     """DTO for creating a new position"""
     position_name: str = Field(..., min_length=1, max_length=100)
@@ -39,6 +43,9 @@ class PositionResponseDTO(BaseModel):
     position_name: str
 
 
+PositionResponseAdapter = TypeAdapter(PositionResponseDTO)
+
+
 class LoginDTO(BaseModel):
     """DTO for login request"""
     username: str = Field(..., min_length=3, max_length=50)
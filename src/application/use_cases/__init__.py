@@ -1,4 +1,5 @@
-from typing import List, Optional
+from dataclasses import replace
+from typing import AsyncIterator, List, Optional
 from uuid import UUID, uuid4
 from ..dtos import (
     EmployeeCreateDTO,
@@ -20,6 +21,10 @@ from ...domain import (
 )
 
 
+# Response DTOs are built with model_construct: their values come from
+# already-validated entities, so pydantic field validation is skipped.
+
+
 class EmployeeUseCase:
     """Use case for employee operations"""
 
@@ -31,6 +36,18 @@ class EmployeeUseCase:
         self._employee_repo = employee_repo
         self._position_repo = position_repo
 
+    @staticmethod
+    def _to_response(
+        employee: Employee, position: Optional[Position]
+    ) -> EmployeeResponseDTO:
+        """Build the response DTO from an employee and its already loaded position"""
+        return EmployeeResponseDTO.model_construct(
+            emp_id=employee.emp_id,
+            name=employee.name,
+            position_id=employee.position_id,
+            position_name=position.position_name if position else None,
+        )
+
     async def create_employee(self, dto: EmployeeCreateDTO) -> EmployeeResponseDTO:
         """Create a new employee"""
         # Verify position exists
@@ -45,50 +62,29 @@ class EmployeeUseCase:
         )
 
         created_employee = await self._employee_repo.create(employee)
-        return EmployeeResponseDTO(
-            emp_id=created_employee.emp_id,
-            name=created_employee.name,
-            position_id=created_employee.position_id,
-            position_name=position.position_name,
-        )
+        return self._to_response(created_employee, position)
 
     async def get_employee(self, emp_id: UUID) -> Optional[EmployeeResponseDTO]:
         """Get employee by ID"""
-        employee = await self._employee_repo.get_by_id(emp_id)
+        employee = await self._employee_repo.get_with_position(emp_id)
         if not employee:
             return None
 
-        position = await self._position_repo.get_by_id(employee.position_id)
-        return EmployeeResponseDTO(
-            emp_id=employee.emp_id,
-            name=employee.name,
-            position_id=employee.position_id,
-            position_name=position.position_name if position else None,
-        )
+        return self._to_response(employee, employee.position)
 
     async def get_all_employees(self) -> List[EmployeeResponseDTO]:
         """Get all employees"""
-        employees = await self._employee_repo.get_all()
-        result = []
-
-        for employee in employees:
-            position = await self._position_repo.get_by_id(employee.position_id)
-            result.append(
-                EmployeeResponseDTO(
-                    emp_id=employee.emp_id,
-                    name=employee.name,
-                    position_id=employee.position_id,
-                    position_name=position.position_name if position else None,
-                )
-            )
-
-        return result
+        # Positions come back joined in the same query, no lookup per row
+        employees = await self._employee_repo.get_all_with_positions()
+        return [
+            self._to_response(employee, employee.position) for employee in employees
+        ]
 
     async def update_employee(
         self, emp_id: UUID, dto: EmployeeUpdateDTO
     ) -> Optional[EmployeeResponseDTO]:
         """Update employee"""
-        employee = await self._employee_repo.get_by_id(emp_id)
+        employee = await self._employee_repo.get_with_position(emp_id)
         if not employee:
             return None
 
@@ -96,22 +92,16 @@ class EmployeeUseCase:
             position = await self._position_repo.get_by_id(dto.position_id)
             if not position:
                 raise ValueError("Position not found")
-            employee.position_id = dto.position_id
+            employee = replace(employee, position_id=dto.position_id, position=position)
 
         if dto.name:
-            employee.name = dto.name
+            employee = replace(employee, name=dto.name)
 
         updated_employee = await self._employee_repo.update(employee)
         if not updated_employee:
             return None
 
-        position = await self._position_repo.get_by_id(updated_employee.position_id)
-        return EmployeeResponseDTO(
-            emp_id=updated_employee.emp_id,
-            name=updated_employee.name,
-            position_id=updated_employee.position_id,
-            position_name=position.position_name if position else None,
-        )
+        return self._to_response(updated_employee, employee.position)
 
     async def delete_employee(self, emp_id: UUID) -> bool:
         """Delete employee"""
@@ -132,7 +122,7 @@ class PositionUseCase:
         )
 
         created_position = await self._position_repo.create(position)
-        return PositionResponseDTO(
+        return PositionResponseDTO.model_construct(
             position_id=created_position.position_id,
             position_name=created_position.position_name,
         )
@@ -143,7 +133,7 @@ class PositionUseCase:
         if not position:
             return None
 
-        return PositionResponseDTO(
+        return PositionResponseDTO.model_construct(
             position_id=position.position_id,
             position_name=position.position_name,
         )
@@ -152,13 +142,21 @@ class PositionUseCase:
         """Get all positions"""
         positions = await self._position_repo.get_all()
         return [
-            PositionResponseDTO(
+            PositionResponseDTO.model_construct(
                 position_id=position.position_id,
                 position_name=position.position_name,
             )
             for position in positions
         ]
 
+    async def iter_all_positions(self) -> AsyncIterator[PositionResponseDTO]:
+        """Yield all positions one at a time"""
+        async for position in self._position_repo.iter_all():
+            yield PositionResponseDTO.model_construct(
+                position_id=position.position_id,
+                position_name=position.position_name,
+            )
+
     async def update_position(
         self, position_id: UUID, dto: PositionUpdateDTO
     ) -> Optional[PositionResponseDTO]:
@@ -167,18 +165,18 @@ class PositionUseCase:
         if not position:
             return None
 
-        position.position_name = dto.position_name
+        position = replace(position, position_name=dto.position_name)
         updated_position = await self._position_repo.update(position)
         if not updated_position:
             return None
 
-        return PositionResponseDTO(
+        return PositionResponseDTO.model_construct(
             position_id=updated_position.position_id,
             position_name=updated_position.position_name,
         )
 
     async def delete_position(self, position_id: UUID) -> bool:
-        """Delete position"""
+        """Delete position; ValueError while employees still reference it"""
         return await self._position_repo.delete(position_id)
 
 
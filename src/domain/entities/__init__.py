@@ -3,7 +3,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     """Position domain entity"""
     position_id: UUID
@@ -14,7 +14,7 @@ class Position:
             raise ValueError("Position name cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Employee:
     """Employee domain entity"""
     emp_id: UUID
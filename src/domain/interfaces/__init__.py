@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from ..entities import Employee, Position
 
@@ -9,6 +9,15 @@ class EmployeeRepositoryInterface(ABC):
 
     @abstractmethod
     async def create(self, employee: Employee) -> Employee:
+        """Create an employee; ValueError if ``position_id`` matches no position"""
+        pass
+
+    @abstractmethod
+    async def create_many(self, employees: List[Employee]) -> List[Employee]:
+        """Create several employees in a single transaction
+
+        ValueError if any ``position_id`` matches no position.
+        """
         pass
 
     @abstractmethod
@@ -19,8 +28,19 @@ class EmployeeRepositoryInterface(ABC):
     async def get_all(self) -> List[Employee]:
         pass
 
+    @abstractmethod
+    async def get_with_position(self, emp_id: UUID) -> Optional[Employee]:
+        """Get employee by ID with ``position`` populated"""
+        pass
+
+    @abstractmethod
+    async def get_all_with_positions(self) -> List[Employee]:
+        """Get all employees with ``position`` populated"""
+        pass
+
     @abstractmethod
     async def update(self, employee: Employee) -> Optional[Employee]:
+        """Update an employee; ValueError if ``position_id`` matches no position"""
         pass
 
     @abstractmethod
@@ -35,6 +55,11 @@ class PositionRepositoryInterface(ABC):
     async def create(self, position: Position) -> Position:
         pass
 
+    @abstractmethod
+    async def create_many(self, positions: List[Position]) -> List[Position]:
+        """Create several positions in a single transaction"""
+        pass
+
     @abstractmethod
     async def get_by_id(self, position_id: UUID) -> Optional[Position]:
         pass
@@ -43,12 +68,18 @@ class PositionRepositoryInterface(ABC):
     async def get_all(self) -> List[Position]:
         pass
 
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Position]:
+        """Yield all positions, reading ``chunk_size`` rows from the database at a time"""
+        pass
+
     @abstractmethod
     async def update(self, position: Position) -> Optional[Position]:
         pass
 
     @abstractmethod
     async def delete(self, position_id: UUID) -> bool:
+        """Delete a position; ValueError while employees still reference it"""
         pass
 
 
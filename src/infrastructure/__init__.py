@@ -8,6 +8,7 @@ from .auth import (
     JWTService,
     SQLiteAuthRepository,
 )
+from .cache import CachedPositionRepository
 
 __all__ = [
     "DatabaseConnection",
@@ -15,4 +16,5 @@ __all__ = [
     "SQLitePositionRepository",
     "JWTService",
     "SQLiteAuthRepository",
+    "CachedPositionRepository",
 ]
\ No newline at end of file
@@ -1,10 +1,46 @@
+import asyncio
 import aiosqlite
 import bcrypt
-from jose import JWTError, jwt
-from datetime import datetime, timedelta, timezone
+import jwt
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
 from ...domain import AuthRepositoryInterface
 
+DEFAULT_TOKEN_EXPIRE_SECONDS = 24 * 60 * 60
+
+# Fixed SQL text so sqlite3's per-connection statement cache on the shared
+# connection keeps these prepared across requests
+_INSERT_USER_SQL = "INSERT INTO users (username, password_hash) VALUES (?, ?)"
+_SELECT_USER_SQL = "SELECT password_hash FROM users WHERE username = ?"
+
+
+def hash_password(password: str) -> str:
+    """Hash password using bcrypt"""
+    salt = bcrypt.gensalt()
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    """Verify password against hash"""
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+# bcrypt releases the GIL while hashing, so threads run it in parallel without
+# a process pool's pickling and startup cost. A dedicated pool sized to the CPU
+# count keeps a burst of logins from tying up the loop's default executor.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+
+
+async def run_in_password_pool(func, *args):
+    """Run a password hashing function off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
 
 class JWTService:
     """JWT token service"""
@@ -12,24 +48,27 @@ class JWTService:
     def __init__(self, secret_key: str, algorithm: str = "HS256"):
         self.secret_key = secret_key
         self.algorithm = algorithm
+        # Prepared once; verify_token runs on every authenticated request
+        self._key = secret_key.encode("utf-8")
+        self._algorithms = [algorithm]
 
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None):
         """Create JWT access token"""
         to_encode = data.copy()
+        # "exp" is a NumericDate, so plain epoch seconds avoid datetime/tz objects
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
         else:
-            expire = datetime.now(timezone.utc) + timedelta(hours=24)
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+            to_encode["exp"] = int(time.time()) + DEFAULT_TOKEN_EXPIRE_SECONDS
+        encoded_jwt = jwt.encode(to_encode, self._key, algorithm=self.algorithm)
         return encoded_jwt
 
     def verify_token(self, token: str) -> Optional[dict]:
         """Verify JWT token"""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
             return payload
-        except JWTError:
+        except jwt.PyJWTError:
             return None
 
 
@@ -39,24 +78,13 @@ class SQLiteAuthRepository(AuthRepositoryInterface):
     def __init__(self, db_connection):
         self._db = db_connection
 
-    def _hash_password(self, password: str) -> str:
-        """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
-
-    def _verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-
     async def create_user(self, username: str, password: str) -> bool:
         """Create a new user"""
         try:
-            hashed_password = self._hash_password(password)
+            # bcrypt is deliberately slow; keep it off the event loop
+            hashed_password = await run_in_password_pool(hash_password, password)
             async with self._db.get_connection() as db:
-                await db.execute(
-                    "INSERT INTO users (username, password_hash) VALUES (?, ?)",
-                    (username, hashed_password),
-                )
+                await db.execute(_INSERT_USER_SQL, (username, hashed_password))
                 await db.commit()
             return True
         except Exception:
@@ -65,11 +93,9 @@ class SQLiteAuthRepository(AuthRepositoryInterface):
     async def verify_user(self, username: str, password: str) -> bool:
         """Verify user credentials"""
         async with self._db.get_connection() as db:
-            cursor = await db.execute(
-                "SELECT password_hash FROM users WHERE username = ?",
-                (username,),
-            )
+            cursor = await db.execute(_SELECT_USER_SQL, (username,))
             row = await cursor.fetchone()
-            if row:
-                return self._verify_password(password, row[0])
+        # Check the hash after releasing the shared connection
+        if row:
+            return await run_in_password_pool(verify_password, password, row[0])
         return False
\ No newline at end of file
@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+from ...domain import Position, PositionRepositoryInterface
+
+
+class CachedPositionRepository(PositionRepositoryInterface):
+    """Position repository decorator with an in-process TTL cache for get_by_id
+
+    Positions are few and rarely change, so the lookups done on every employee
+    create/update are served from memory. Writes made through this repository
+    invalidate the affected entry; the cache is per process, so other workers
+    can see a stale position for at most ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        repository: PositionRepositoryInterface,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+    ):
+        self._repo = repository
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._cache: "OrderedDict[UUID, Tuple[float, Position]]" = OrderedDict()
+
+    def invalidate(self, position_id: UUID) -> None:
+        """Drop a cached position"""
+        self._cache.pop(position_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached positions"""
+        self._cache.clear()
+
+    async def create(self, position: Position) -> Position:
+        return await self._repo.create(position)
+
+    async def create_many(self, positions: List[Position]) -> List[Position]:
+        return await self._repo.create_many(positions)
+
+    async def get_by_id(self, position_id: UUID) -> Optional[Position]:
+        now = time.monotonic()
+        entry = self._cache.get(position_id)
+        if entry is not None:
+            expires_at, position = entry
+            if expires_at > now:
+                self._cache.move_to_end(position_id)
+                return position
+            del self._cache[position_id]
+
+        position = await self._repo.get_by_id(position_id)
+        if position is not None:
+            self._cache[position_id] = (now + self._ttl, position)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return position
+
+    async def get_all(self) -> List[Position]:
+        return await self._repo.get_all()
+
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Position]:
+        async for position in self._repo.iter_all(chunk_size):
+            yield position
+
+    async def update(self, position: Position) -> Optional[Position]:
+        try:
+            return await self._repo.update(position)
+        finally:
+            self.invalidate(position.position_id)
+
+    async def delete(self, position_id: UUID) -> bool:
+        try:
+            return await self._repo.delete(position_id)
+        finally:
+            self.invalidate(position_id)
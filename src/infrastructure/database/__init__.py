@@ -1,36 +1,154 @@
+import asyncio
 import sqlite3
+import threading
 import aiosqlite
-from typing import List, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, List, Optional
 from uuid import UUID
 from ...domain import Employee, Position, EmployeeRepositoryInterface, PositionRepositoryInterface
+from ..queries import SELECT_EMPLOYEE_WITH_POSITION, employee_with_position
+
+# UUIDs are stored as 16-byte BLOBs in columns declared as UUID; sqlite3 does
+# the conversion in both directions, so repositories bind and read UUID objects.
+sqlite3.register_adapter(UUID, lambda value: value.bytes)
+sqlite3.register_converter("UUID", lambda value: UUID(bytes=value))
+
+# Applied once per connection: enforce foreign keys (off by default in SQLite),
+# fsync only at WAL checkpoints, a 64 MiB page cache and 256 MiB of
+# memory-mapped I/O for reads
+_CONNECTION_PRAGMAS = """
+PRAGMA foreign_keys=ON;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+PRAGMA temp_store=MEMORY;
+"""
+
+# Tables with UUID id columns, in creation order: column definitions and the
+# names of the UUID columns. Kept together so the TEXT-id migration builds the
+# new table exactly like a fresh one.
+_UUID_TABLES = {
+    "positions": (
+        """
+        position_id UUID PRIMARY KEY,
+        position_name TEXT NOT NULL
+        """,
+        ("position_id",),
+    ),
+    "employees": (
+        """
+        emp_id UUID PRIMARY KEY,
+        name TEXT NOT NULL,
+        position_id UUID NOT NULL,
+        FOREIGN KEY (position_id) REFERENCES positions (position_id)
+        """,
+        ("emp_id", "position_id"),
+    ),
+}
+
+
+async def _migrate_text_ids(
+    db: aiosqlite.Connection, table: str, columns: str, uuid_columns: tuple
+) -> None:
+    """Rewrite a table whose id columns still hold UUIDs as TEXT
+
+    Runs in one transaction: the table is copied into a new one with UUID
+    columns, converting each id with ``UUID(text)``, then swapped in. Raises
+    RuntimeError, leaving the database untouched, if an id isn't a valid UUID.
+    """
+    cursor = await db.execute(f"PRAGMA table_info({table})")
+    declared = {name: decl_type.upper() for _, name, decl_type, *_ in await cursor.fetchall()}
+    if not declared or all(declared.get(name) == "UUID" for name in uuid_columns):
+        return
+
+    column_names = list(declared)
+    cursor = await db.execute(f"SELECT {', '.join(column_names)} FROM {table}")
+    rows = []
+    for row in await cursor.fetchall():
+        values = dict(zip(column_names, row))
+        for name in uuid_columns:
+            value = values[name]
+            if isinstance(value, str):
+                try:
+                    values[name] = UUID(value)
+                except ValueError:
+                    raise RuntimeError(
+                        f"Cannot migrate {table}.{name}: {value!r} is not a UUID"
+                    ) from None
+        rows.append(tuple(values[name] for name in column_names))
+
+    # Dropping positions would otherwise trip the employees foreign key while
+    # the tables are swapped one at a time. The PRAGMA is ignored inside a
+    # transaction, so it is switched off before BEGIN and back on after it ends.
+    await db.execute("PRAGMA foreign_keys=OFF")
+    try:
+        await db.execute("BEGIN")
+        await db.execute(f"CREATE TABLE {table}_uuid_migration ({columns})")
+        await db.executemany(
+            f"INSERT INTO {table}_uuid_migration ({', '.join(column_names)}) "
+            f"VALUES ({', '.join('?' for _ in column_names)})",
+            rows,
+        )
+        await db.execute(f"DROP TABLE {table}")
+        await db.execute(f"ALTER TABLE {table}_uuid_migration RENAME TO {table}")
+        await db.commit()
+    finally:
+        if db.in_transaction:
+            await db.rollback()
+        await db.execute("PRAGMA foreign_keys=ON")
 
 
 class DatabaseConnection:
-    """Database connection manager"""
+    """Database connection manager
+
+    Keeps a single long-lived aiosqlite connection instead of opening one per
+    repository call, so the worker thread, page cache and statement cache are
+    reused across requests.
+    """
 
     def __init__(self, db_path: str = "employees.db"):
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        # SQLite serializes writers anyway; the lock keeps units of work from
+        # interleaving their statements and commits on the shared connection
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open the shared connection on first use"""
+        if self._conn is None:
+            conn = aiosqlite.connect(
+                self.db_path, detect_types=sqlite3.PARSE_DECLTYPES
+            )
+            # Don't let an unclosed connection's worker thread block interpreter
+            # exit. Only possible while aiosqlite's Connection subclasses
+            # threading.Thread (true for the pinned 0.19); close() is still
+            # the real cleanup and the app lifespan always calls it.
+            if isinstance(conn, threading.Thread):
+                conn.daemon = True
+            await conn
+            pragmas = _CONNECTION_PRAGMAS
+            if self.db_path != ":memory:":
+                # In-memory databases can't use WAL
+                pragmas = "PRAGMA journal_mode=WAL;\n" + pragmas
+            await conn.executescript(pragmas)
+            self._conn = conn
+        return self._conn
 
     async def initialize(self):
-        """Initialize database tables"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS positions (
-                    position_id TEXT PRIMARY KEY,
-                    position_name TEXT NOT NULL
+        """Initialize database tables
+
+        Tables left by earlier versions, which stored ids as 36-character
+        TEXT, are migrated to the binary UUID columns first.
+        """
+        async with self.get_connection() as db:
+            for table, (columns, uuid_columns) in _UUID_TABLES.items():
+                await _migrate_text_ids(db, table, columns, uuid_columns)
+                await db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ({columns})"
                 )
-                """
-            )
             await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS employees (
-                    emp_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    position_id TEXT NOT NULL,
-                    FOREIGN KEY (position_id) REFERENCES positions (position_id)
-                )
-                """
+                "CREATE INDEX IF NOT EXISTS idx_employees_position_id "
+                "ON employees (position_id)"
             )
             await db.execute(
                 """
@@ -43,9 +161,38 @@ class DatabaseConnection:
             )
             await db.commit()
 
-    def get_connection(self):
-        """Get database connection"""
-        return aiosqlite.connect(self.db_path)
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Get the shared database connection
+
+        The connection stays open when the block exits; an uncommitted
+        transaction is rolled back if the block raises.
+        """
+        async with self._lock:
+            db = await self._connect()
+            try:
+                yield db
+            except BaseException:
+                if db.in_transaction:
+                    await db.rollback()
+                raise
+
+    async def close(self):
+        """Close the shared connection"""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+
+@contextmanager
+def _foreign_key_errors(message: str) -> Iterator[None]:
+    """Re-raise FOREIGN KEY constraint failures as ValueError(message)"""
+    try:
+        yield
+    except sqlite3.IntegrityError as e:
+        if "FOREIGN KEY" not in str(e):
+            raise
+        raise ValueError(message) from e
 
 
 class SQLiteEmployeeRepository(EmployeeRepositoryInterface):
@@ -55,26 +202,37 @@ class SQLiteEmployeeRepository(EmployeeRepositoryInterface):
         self._db = db_connection
 
     async def create(self, employee: Employee) -> Employee:
-        async with self._db.get_connection() as db:
-            await db.execute(
-                "INSERT INTO employees (emp_id, name, position_id) VALUES (?, ?, ?)",
-                (str(employee.emp_id), employee.name, str(employee.position_id)),
-            )
-            await db.commit()
+        with _foreign_key_errors("Position not found"):
+            async with self._db.get_connection() as db:
+                await db.execute(
+                    "INSERT INTO employees (emp_id, name, position_id) VALUES (?, ?, ?)",
+                    (employee.emp_id, employee.name, employee.position_id),
+                )
+                await db.commit()
         return employee
 
+    async def create_many(self, employees: List[Employee]) -> List[Employee]:
+        with _foreign_key_errors("Position not found"):
+            async with self._db.get_connection() as db:
+                await db.executemany(
+                    "INSERT INTO employees (emp_id, name, position_id) VALUES (?, ?, ?)",
+                    [(e.emp_id, e.name, e.position_id) for e in employees],
+                )
+                await db.commit()
+        return employees
+
     async def get_by_id(self, emp_id: UUID) -> Optional[Employee]:
         async with self._db.get_connection() as db:
             cursor = await db.execute(
                 "SELECT emp_id, name, position_id FROM employees WHERE emp_id = ?",
-                (str(emp_id),),
+                (emp_id,),
             )
             row = await cursor.fetchone()
             if row:
                 return Employee(
-                    emp_id=UUID(row[0]),
+                    emp_id=row[0],
                     name=row[1],
-                    position_id=UUID(row[2]),
+                    position_id=row[2],
                 )
         return None
 
@@ -85,30 +243,46 @@ class SQLiteEmployeeRepository(EmployeeRepositoryInterface):
             )
             rows = await cursor.fetchall()
             return [
-                Employee(
-                    emp_id=UUID(row[0]),
-                    name=row[1],
-                    position_id=UUID(row[2]),
-                )
-                for row in rows
+                Employee(emp_id=emp_id, name=name, position_id=position_id)
+                for emp_id, name, position_id in rows
             ]
 
-    async def update(self, employee: Employee) -> Optional[Employee]:
+    async def get_with_position(self, emp_id: UUID) -> Optional[Employee]:
         async with self._db.get_connection() as db:
-            await db.execute(
-                "UPDATE employees SET name = ?, position_id = ? WHERE emp_id = ?",
-                (employee.name, str(employee.position_id), str(employee.emp_id)),
+            cursor = await db.execute(
+                SELECT_EMPLOYEE_WITH_POSITION + " WHERE e.emp_id = ?",
+                (emp_id,),
             )
-            await db.commit()
-            if db.total_changes > 0:
-                return employee
+            row = await cursor.fetchone()
+            if row:
+                return employee_with_position(row)
+        return None
+
+    async def get_all_with_positions(self) -> List[Employee]:
+        async with self._db.get_connection() as db:
+            cursor = await db.execute(SELECT_EMPLOYEE_WITH_POSITION)
+            rows = await cursor.fetchall()
+            return [employee_with_position(row) for row in rows]
+
+    async def update(self, employee: Employee) -> Optional[Employee]:
+        with _foreign_key_errors("Position not found"):
+            async with self._db.get_connection() as db:
+                cursor = await db.execute(
+                    "UPDATE employees SET name = ?, position_id = ? WHERE emp_id = ?",
+                    (employee.name, employee.position_id, employee.emp_id),
+                )
+                await db.commit()
+                if cursor.rowcount > 0:
+                    return employee
         return None
 
     async def delete(self, emp_id: UUID) -> bool:
         async with self._db.get_connection() as db:
-            await db.execute("DELETE FROM employees WHERE emp_id = ?", (str(emp_id),))
+            cursor = await db.execute(
+                "DELETE FROM employees WHERE emp_id = ?", (emp_id,)
+            )
             await db.commit()
-            return db.total_changes > 0
+            return cursor.rowcount > 0
 
 
 class SQLitePositionRepository(PositionRepositoryInterface):
@@ -121,21 +295,30 @@ class SQLitePositionRepository(PositionRepositoryInterface):
         async with self._db.get_connection() as db:
             await db.execute(
                 "INSERT INTO positions (position_id, position_name) VALUES (?, ?)",
-                (str(position.position_id), position.position_name),
+                (position.position_id, position.position_name),
             )
             await db.commit()
         return position
 
+    async def create_many(self, positions: List[Position]) -> List[Position]:
+        async with self._db.get_connection() as db:
+            await db.executemany(
+                "INSERT INTO positions (position_id, position_name) VALUES (?, ?)",
+                [(p.position_id, p.position_name) for p in positions],
+            )
+            await db.commit()
+        return positions
+
     async def get_by_id(self, position_id: UUID) -> Optional[Position]:
         async with self._db.get_connection() as db:
             cursor = await db.execute(
                 "SELECT position_id, position_name FROM positions WHERE position_id = ?",
-                (str(position_id),),
+                (position_id,),
             )
             row = await cursor.fetchone()
             if row:
                 return Position(
-                    position_id=UUID(row[0]),
+                    position_id=row[0],
                     position_name=row[1],
                 )
         return None
@@ -147,28 +330,44 @@ class SQLitePositionRepository(PositionRepositoryInterface):
             )
             rows = await cursor.fetchall()
             return [
-                Position(
-                    position_id=UUID(row[0]),
-                    position_name=row[1],
-                )
-                for row in rows
+                Position(position_id=position_id, position_name=position_name)
+                for position_id, position_name in rows
             ]
 
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Position]:
+        # Keyset pagination on rowid: the shared connection is only held while
+        # a chunk is fetched, never while the caller consumes it
+        last_rowid = 0
+        while True:
+            async with self._db.get_connection() as db:
+                cursor = await db.execute(
+                    "SELECT rowid, position_id, position_name FROM positions "
+                    "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, chunk_size),
+                )
+                rows = await cursor.fetchall()
+            for rowid, position_id, position_name in rows:
+                yield Position(position_id=position_id, position_name=position_name)
+            if len(rows) < chunk_size:
+                return
+            last_rowid = rows[-1][0]
+
     async def update(self, position: Position) -> Optional[Position]:
         async with self._db.get_connection() as db:
-            await db.execute(
+            cursor = await db.execute(
                 "UPDATE positions SET position_name = ? WHERE position_id = ?",
-                (position.position_name, str(position.position_id)),
+                (position.position_name, position.position_id),
             )
             await db.commit()
-            if db.total_changes > 0:
+            if cursor.rowcount > 0:
                 return position
         return None
 
     async def delete(self, position_id: UUID) -> bool:
-        async with self._db.get_connection() as db:
-            await db.execute(
-                "DELETE FROM positions WHERE position_id = ?", (str(position_id),)
-            )
-            await db.commit()
-            return db.total_changes > 0
\ No newline at end of file
+        with _foreign_key_errors("Position is assigned to employees"):
+            async with self._db.get_connection() as db:
+                cursor = await db.execute(
+                    "DELETE FROM positions WHERE position_id = ?", (position_id,)
+                )
+                await db.commit()
+                return cursor.rowcount > 0
\ No newline at end of file
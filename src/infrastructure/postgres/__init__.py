@@ -0,0 +1,273 @@
+import asyncpg
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, List, Optional
+from uuid import UUID
+from ...domain import (
+    Employee,
+    Position,
+    EmployeeRepositoryInterface,
+    PositionRepositoryInterface,
+    AuthRepositoryInterface,
+)
+# Through the module, so tests patching auth.hash_password reach these calls
+from .. import auth
+from ..queries import SELECT_EMPLOYEE_WITH_POSITION, employee_with_position
+
+
+class PostgresConnection:
+    """PostgreSQL connection pool manager
+
+    Optional backend for deployments that outgrow SQLite's single writer.
+    Requires ``asyncpg``; the pool is created by ``initialize()`` and each
+    process (uvicorn worker) gets its own pool.
+    """
+
+    def __init__(self, dsn: str, min_size: int = 5, max_size: int = 25):
+        self.dsn = dsn
+        self._min_size = min_size
+        self._max_size = max_size
+        self._pool: Optional[asyncpg.Pool] = None
+
+    async def initialize(self):
+        """Create the pool and initialize database tables"""
+        if self._pool is None:
+            self._pool = await asyncpg.create_pool(
+                self.dsn, min_size=self._min_size, max_size=self._max_size
+            )
+        async with self.get_connection() as db:
+            # Tables created before the foreign key existed get it added NOT
+            # VALID: enforced for new writes, existing rows left unchecked
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS positions (
+                    position_id UUID PRIMARY KEY,
+                    position_name TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS employees (
+                    emp_id UUID PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    position_id UUID NOT NULL
+                        REFERENCES positions (position_id)
+                );
+                DO $$ BEGIN
+                    ALTER TABLE employees
+                        ADD CONSTRAINT employees_position_id_fkey
+                        FOREIGN KEY (position_id) REFERENCES positions (position_id)
+                        NOT VALID;
+                EXCEPTION WHEN duplicate_object THEN NULL;
+                END $$;
+                CREATE INDEX IF NOT EXISTS idx_employees_position_id
+                    ON employees (position_id);
+                CREATE TABLE IF NOT EXISTS users (
+                    id BIGSERIAL PRIMARY KEY,
+                    username TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL
+                );
+                """
+            )
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection from the pool"""
+        if self._pool is None:
+            raise RuntimeError("PostgresConnection.initialize() has not been called")
+        async with self._pool.acquire() as db:
+            yield db
+
+    async def close(self):
+        """Close the pool"""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+
+def _affected_rows(status: str) -> int:
+    """Row count from a command status such as ``UPDATE 1``"""
+    return int(status.rsplit(" ", 1)[-1])
+
+
+@contextmanager
+def _foreign_key_errors(message: str) -> Iterator[None]:
+    """Re-raise foreign key violations as ValueError(message)"""
+    try:
+        yield
+    except asyncpg.ForeignKeyViolationError as e:
+        raise ValueError(message) from e
+
+
+class PostgresEmployeeRepository(EmployeeRepositoryInterface):
+    """PostgreSQL implementation of Employee repository"""
+
+    def __init__(self, db_connection: PostgresConnection):
+        self._db = db_connection
+
+    async def create(self, employee: Employee) -> Employee:
+        with _foreign_key_errors("Position not found"):
+            async with self._db.get_connection() as db:
+                await db.execute(
+                    "INSERT INTO employees (emp_id, name, position_id) VALUES ($1, $2, $3)",
+                    employee.emp_id, employee.name, employee.position_id,
+                )
+        return employee
+
+    async def create_many(self, employees: List[Employee]) -> List[Employee]:
+        with _foreign_key_errors("Position not found"):
+            async with self._db.get_connection() as db:
+                async with db.transaction():
+                    await db.executemany(
+                        "INSERT INTO employees (emp_id, name, position_id) VALUES ($1, $2, $3)",
+                        [(e.emp_id, e.name, e.position_id) for e in employees],
+                    )
+        return employees
+
+    async def get_by_id(self, emp_id: UUID) -> Optional[Employee]:
+        async with self._db.get_connection() as db:
+            row = await db.fetchrow(
+                "SELECT emp_id, name, position_id FROM employees WHERE emp_id = $1",
+                emp_id,
+            )
+        if row:
+            emp_id, name, position_id = row
+            return Employee(emp_id=emp_id, name=name, position_id=position_id)
+        return None
+
+    async def get_all(self) -> List[Employee]:
+        async with self._db.get_connection() as db:
+            rows = await db.fetch("SELECT emp_id, name, position_id FROM employees")
+        return [
+            Employee(emp_id=emp_id, name=name, position_id=position_id)
+            for emp_id, name, position_id in rows
+        ]
+
+    async def get_with_position(self, emp_id: UUID) -> Optional[Employee]:
+        async with self._db.get_connection() as db:
+            row = await db.fetchrow(
+                SELECT_EMPLOYEE_WITH_POSITION + " WHERE e.emp_id = $1", emp_id
+            )
+        if row:
+            return employee_with_position(row)
+        return None
+
+    async def get_all_with_positions(self) -> List[Employee]:
+        async with self._db.get_connection() as db:
+            rows = await db.fetch(SELECT_EMPLOYEE_WITH_POSITION)
+        return [employee_with_position(row) for row in rows]
+
+    async def update(self, employee: Employee) -> Optional[Employee]:
+        with _foreign_key_errors("Position not found"):
+            async with self._db.get_connection() as db:
+                status = await db.execute(
+                    "UPDATE employees SET name = $1, position_id = $2 WHERE emp_id = $3",
+                    employee.name, employee.position_id, employee.emp_id,
+                )
+        if _affected_rows(status) > 0:
+            return employee
+        return None
+
+    async def delete(self, emp_id: UUID) -> bool:
+        async with self._db.get_connection() as db:
+            status = await db.execute("DELETE FROM employees WHERE emp_id = $1", emp_id)
+        return _affected_rows(status) > 0
+
+
+class PostgresPositionRepository(PositionRepositoryInterface):
+    """PostgreSQL implementation of Position repository"""
+
+    def __init__(self, db_connection: PostgresConnection):
+        self._db = db_connection
+
+    async def create(self, position: Position) -> Position:
+        async with self._db.get_connection() as db:
+            await db.execute(
+                "INSERT INTO positions (position_id, position_name) VALUES ($1, $2)",
+                position.position_id, position.position_name,
+            )
+        return position
+
+    async def create_many(self, positions: List[Position]) -> List[Position]:
+        async with self._db.get_connection() as db:
+            async with db.transaction():
+                await db.executemany(
+                    "INSERT INTO positions (position_id, position_name) VALUES ($1, $2)",
+                    [(p.position_id, p.position_name) for p in positions],
+                )
+        return positions
+
+    async def get_by_id(self, position_id: UUID) -> Optional[Position]:
+        async with self._db.get_connection() as db:
+            row = await db.fetchrow(
+                "SELECT position_id, position_name FROM positions WHERE position_id = $1",
+                position_id,
+            )
+        if row:
+            position_id, position_name = row
+            return Position(position_id=position_id, position_name=position_name)
+        return None
+
+    async def get_all(self) -> List[Position]:
+        async with self._db.get_connection() as db:
+            rows = await db.fetch("SELECT position_id, position_name FROM positions")
+        return [
+            Position(position_id=position_id, position_name=position_name)
+            for position_id, position_name in rows
+        ]
+
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Position]:
+        # Server-side cursor; holds one pool connection while iterating
+        async with self._db.get_connection() as db:
+            async with db.transaction():
+                async for position_id, position_name in db.cursor(
+                    "SELECT position_id, position_name FROM positions",
+                    prefetch=chunk_size,
+                ):
+                    yield Position(position_id=position_id, position_name=position_name)
+
+    async def update(self, position: Position) -> Optional[Position]:
+        async with self._db.get_connection() as db:
+            status = await db.execute(
+                "UPDATE positions SET position_name = $1 WHERE position_id = $2",
+                position.position_name, position.position_id,
+            )
+        if _affected_rows(status) > 0:
+            return position
+        return None
+
+    async def delete(self, position_id: UUID) -> bool:
+        with _foreign_key_errors("Position is assigned to employees"):
+            async with self._db.get_connection() as db:
+                status = await db.execute(
+                    "DELETE FROM positions WHERE position_id = $1", position_id
+                )
+        return _affected_rows(status) > 0
+
+
+class PostgresAuthRepository(AuthRepositoryInterface):
+    """PostgreSQL implementation of Auth repository"""
+
+    def __init__(self, db_connection: PostgresConnection):
+        self._db = db_connection
+
+    async def create_user(self, username: str, password: str) -> bool:
+        """Create a new user"""
+        try:
+            hashed_password = await auth.run_in_password_pool(auth.hash_password, password)
+            async with self._db.get_connection() as db:
+                await db.execute(
+                    "INSERT INTO users (username, password_hash) VALUES ($1, $2)",
+                    username, hashed_password,
+                )
+            return True
+        except Exception:
+            return False
+
+    async def verify_user(self, username: str, password: str) -> bool:
+        """Verify user credentials"""
+        async with self._db.get_connection() as db:
+            password_hash = await db.fetchval(
+                "SELECT password_hash FROM users WHERE username = $1", username
+            )
+        if password_hash:
+            return await auth.run_in_password_pool(
+                auth.verify_password, password, password_hash
+            )
+        return False
@@ -0,0 +1,23 @@
+from ...domain import Employee, Position
+
+# Shared by the SQLite and PostgreSQL employee repositories; callers append
+# their own WHERE clause with the backend's placeholder style.
+SELECT_EMPLOYEE_WITH_POSITION = """
+    SELECT e.emp_id, e.name, e.position_id, p.position_name
+    FROM employees e
+    LEFT JOIN positions p ON p.position_id = e.position_id
+"""
+
+
+def employee_with_position(row) -> Employee:
+    """Build an Employee from a SELECT_EMPLOYEE_WITH_POSITION row"""
+    emp_id, name, position_id, position_name = row
+    position = None
+    if position_name is not None:
+        position = Position(position_id=position_id, position_name=position_name)
+    return Employee(
+        emp_id=emp_id,
+        name=name,
+        position_id=position_id,
+        position=position,
+    )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List
 from uuid import UUID
 from ...application import (
@@ -6,6 +6,7 @@ from ...application import (
     EmployeeCreateDTO,
     EmployeeUpdateDTO,
     EmployeeResponseDTO,
+    EmployeeResponseListAdapter,
 )
 from ..dependencies import get_employee_use_case, get_current_user
 
@@ -60,7 +61,13 @@ async def get_all_employees(
     current_user: str = Depends(get_current_user),
 ):
     """Get all employees"""
-    return await employee_use_case.get_all_employees()
+    # Serialize the whole list in pydantic-core instead of re-validating each
+    # item against response_model (kept for the OpenAPI schema)
+    employees = await employee_use_case.get_all_employees()
+    return Response(
+        content=EmployeeResponseListAdapter.dump_json(employees),
+        media_type="application/json",
+    )
 
 
 @router.put(
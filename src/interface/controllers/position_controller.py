@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List
 from uuid import UUID
 from ...application import (
     PositionUseCase,
     PositionCreateDTO,
     PositionUpdateDTO,
     PositionResponseDTO,
+    PositionResponseAdapter,
 )
 from ..dependencies import get_position_use_case, get_current_user
 
@@ -13,6 +15,27 @@ from ..dependencies import get_position_use_case, get_current_user
 router = APIRouter(prefix="/positions", tags=["positions"])
 
 
+def _position_response(
+    position: PositionResponseDTO, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize a position in pydantic-core, skipping response_model re-validation"""
+    return Response(
+        content=PositionResponseAdapter.dump_json(position),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def _json_array(positions: AsyncIterator[PositionResponseDTO]) -> AsyncIterator[bytes]:
+    """Encode positions as a JSON array, one element per chunk"""
+    yield b"["
+    separator = b""
+    async for position in positions:
+        yield separator + PositionResponseAdapter.dump_json(position)
+        separator = b","
+    yield b"]"
+
+
 @router.post(
     "/",
     response_model=PositionResponseDTO,
@@ -25,7 +48,8 @@ async def create_position(
     current_user: str = Depends(get_current_user),
 ):
     """Create a new position"""
-    return await position_use_case.create_position(position_data)
+    position = await position_use_case.create_position(position_data)
+    return _position_response(position, status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -44,7 +68,7 @@ async def get_position(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Position not found"
         )
-    return position
+    return _position_response(position)
 
 
 @router.get(
@@ -57,7 +81,12 @@ async def get_all_positions(
     current_user: str = Depends(get_current_user),
 ):
     """Get all positions"""
-    return await position_use_case.get_all_positions()
+    # Stream rows as they are read so memory stays flat however large the
+    # table; response_model is kept for the OpenAPI schema
+    return StreamingResponse(
+        _json_array(position_use_case.iter_all_positions()),
+        media_type="application/json",
+    )
 
 
 @router.put(
@@ -77,7 +106,7 @@ async def update_position(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Position not found"
         )
-    return position
+    return _position_response(position)
 
 
 @router.delete(
@@ -91,7 +120,10 @@ async def delete_position(
     current_user: str = Depends(get_current_user),
 ):
     """Delete position"""
-    success = await position_use_case.delete_position(position_id)
+    try:
+        success = await position_use_case.delete_position(position_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Position not found"
@@ -1,3 +1,8 @@
+import hashlib
+import os
+import time
+from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from ...infrastructure import (
@@ -6,6 +11,7 @@ from ...infrastructure import (
     SQLitePositionRepository,
     SQLiteAuthRepository,
     JWTService,
+    CachedPositionRepository,
 )
 from ...application import (
     EmployeeUseCase,
@@ -19,24 +25,60 @@ security = HTTPBearer()
 # Configuration
 SECRET_KEY = "your-secret-key-here-change-in-production"
 DATABASE_PATH = "employees.db"
+# Set to a postgresql:// DSN to use the PostgreSQL backend (needs asyncpg)
+DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Database connection
-db_connection = DatabaseConnection(DATABASE_PATH)
+
+def _is_postgres_url(url: Optional[str]) -> bool:
+    """Whether ``url`` selects the PostgreSQL backend"""
+    return bool(url) and url.startswith(("postgres://", "postgresql://"))
+
+
+USE_POSTGRES = _is_postgres_url(DATABASE_URL)
 
 # Services
 jwt_service = JWTService(SECRET_KEY)
 
-# Repositories
-employee_repository = SQLiteEmployeeRepository(db_connection)
-position_repository = SQLitePositionRepository(db_connection)
-auth_repository = SQLiteAuthRepository(db_connection)
+# Database connection and repositories
+if USE_POSTGRES:
+    from ...infrastructure.postgres import (
+        PostgresConnection,
+        PostgresEmployeeRepository,
+        PostgresPositionRepository,
+        PostgresAuthRepository,
+    )
+
+    db_connection = PostgresConnection(DATABASE_URL)
+    employee_repository = PostgresEmployeeRepository(db_connection)
+    base_position_repository = PostgresPositionRepository(db_connection)
+    auth_repository = PostgresAuthRepository(db_connection)
+else:
+    db_connection = DatabaseConnection(DATABASE_PATH)
+    employee_repository = SQLiteEmployeeRepository(db_connection)
+    base_position_repository = SQLitePositionRepository(db_connection)
+    auth_repository = SQLiteAuthRepository(db_connection)
+
+# Position reads are cached per process, so another worker may serve a stale
+# position for up to the TTL. Employee writes check positions against the
+# database itself, never the cache, since a stale entry must not let an
+# employee reference a deleted position.
+position_repository = CachedPositionRepository(base_position_repository)
+
+# Verified token payloads, keyed by the token's SHA-256 so raw tokens are never
+# kept in memory. Only read and written from the event loop, so no lock needed.
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
 
 # Use cases
-employee_use_case = EmployeeUseCase(employee_repository, position_repository)
+employee_use_case = EmployeeUseCase(employee_repository, base_position_repository)
 position_use_case = PositionUseCase(position_repository)
 auth_use_case = AuthUseCase(auth_repository, jwt_service)
 
 
+# Providers stay ``async def``: FastAPI runs sync dependencies in the
+# threadpool, which costs far more than awaiting a coroutine that returns a
+# module-level singleton.
+
 async def get_database():
     """Get database connection dependency"""
     return db_connection
@@ -57,20 +99,33 @@ async def get_auth_use_case() -> AuthUseCase:
     return auth_use_case
 
 
+def _verify_token_cached(token: str) -> Optional[dict]:
+    """Verify a token, reusing the result of a recent successful verification"""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        # Never serve a token past its own expiry, even within the cache TTL
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        del _token_cache[key]
+
+    payload = jwt_service.verify_token(token)
+    if payload is not None:
+        _token_cache[key] = payload
+    return payload
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> str:
     """Get current authenticated user"""
     token = credentials.credentials
-    payload = jwt_service.verify_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    username: str = payload.get("sub")
+    payload = _verify_token_cached(token)
+    username: Optional[str] = payload.get("sub") if payload is not None else None
     if username is None:
+        # A fresh instance per raise: a shared one would accumulate traceback
+        # frames and __context__ across concurrent requests
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
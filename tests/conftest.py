@@ -0,0 +1,51 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import pytest
+
+# Keep the app on its SQLite test database whatever the shell exports; this
+# has to happen before anything imports src.interface.dependencies.
+os.environ.pop("DATABASE_URL", None)
+
+from src.infrastructure import auth
+
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] doesn't install uvloop on Windows
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session
+
+    Shared module and session fixtures (the unit test database, the
+    integration client) hold connections bound to the loop they were created
+    on. A single loop avoids overlapping event_loop scopes, which pytest-asyncio
+    doesn't support. Runs on uvloop, like the app, when it is installed.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _fast_hash(password: str) -> str:
+    return "sha256$" + hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def _fast_verify(password: str, hashed_password: str) -> bool:
+    return hmac.compare_digest(hashed_password, _fast_hash(password))
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hash(monkeypatch):
+    """Swap bcrypt for SHA-256 in the auth repositories
+
+    bcrypt is deliberately slow and every register/login test pays for it.
+    Set PYTEST_FAST_HASH=0 to run the suite against real bcrypt.
+    """
+    if os.getenv("PYTEST_FAST_HASH", "1") == "0":
+        return
+    monkeypatch.setattr(auth, "hash_password", _fast_hash)
+    monkeypatch.setattr(auth, "verify_password", _fast_verify)
@@ -1,53 +1,73 @@
+import asyncio
 import pytest
 import pytest_asyncio
 import tempfile
 import os
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from uuid import uuid4
 from main import app
-from src.interface.dependencies import get_database, db_connection
+from src.interface import dependencies
+from src.infrastructure import DatabaseConnection
+from src.interface.dependencies import db_connection
 
 
-# Override database dependency for testing
-@pytest.fixture
-async def test_db():
-    """Create test database"""
+@pytest.fixture(scope="module")
+def test_db():
+    """Point the app's shared database connection at a temporary file"""
+    # Repointing only works on an unopened SQLite connection
+    assert isinstance(db_connection, DatabaseConnection) and db_connection._conn is None
     fd, path = tempfile.mkstemp(suffix=".db")
     os.close(fd)
-    
-    # Import here to avoid circular imports
-    from src.infrastructure.database import DatabaseConnection
-    test_db_connection = DatabaseConnection(path)
-    await test_db_connection.initialize()
-    
-    # Override the dependency
-    app.dependency_overrides[get_database] = lambda: test_db_connection
-    
-    yield test_db_connection
-    
-    # Cleanup
-    app.dependency_overrides.clear()
-    os.unlink(path)
+    original_path = db_connection.db_path
+    db_connection.db_path = path
 
+    yield db_connection
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
+    # Cleanup
+    db_connection.db_path = original_path
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client(test_db):
+    """Create an async client shared by the whole module
+
+    The app lifespan runs once around the module, creating the tables and,
+    on exit, closing the shared connection. ASGITransport doesn't send
+    lifespan events itself.
+    """
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_state(client):
+    """Reset tables and in-process caches between tests"""
+    yield
+    async with db_connection.get_connection() as db:
+        await db.executescript(
+            "DELETE FROM users; DELETE FROM employees; DELETE FROM positions;"
+        )
+    dependencies.position_repository.clear()
+    dependencies._token_cache.clear()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def auth_token(client, test_db):
     """Create a test user and return auth token"""
     # Register user
-    response = client.post(
+    response = await client.post(
         "/auth/register",
         json={"username": "testuser", "password": "testpass123"}
     )
     assert response.status_code == 201
     
     # Login and get token
-    response = client.post(
+    response = await client.post(
         "/auth/login",
         json={"username": "testuser", "password": "testpass123"}
     )
@@ -56,10 +76,10 @@ async def auth_token(client, test_db):
     return f"Bearer {token}"
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_position(client, auth_token):
     """Create a test position"""
-    response = client.post(
+    response = await client.post(
         "/positions/",
         json={"position_name": "Test Developer"},
         headers={"Authorization": auth_token}
@@ -71,9 +91,9 @@ async def test_position(client, auth_token):
 class TestAuthEndpoints:
     """Test authentication endpoints"""
 
-    def test_register_user_success(self, client, test_db):
+    async def test_register_user_success(self, client, test_db):
         """Test successful user registration"""
-        response = client.post(
+        response = await client.post(
             "/auth/register",
             json={"username": "newuser", "password": "password123"}
         )
@@ -81,32 +101,32 @@ class TestAuthEndpoints:
         assert response.status_code == 201
         assert response.json()["message"] == "User created successfully"
 
-    def test_register_user_duplicate(self, client, test_db):
+    async def test_register_user_duplicate(self, client, test_db):
         """Test duplicate user registration"""
         # Register first user
-        client.post(
+        await client.post(
             "/auth/register",
             json={"username": "testuser", "password": "password123"}
         )
         
         # Try to register again
-        response = client.post(
+        response = await client.post(
             "/auth/register",
             json={"username": "testuser", "password": "password123"}
         )
         
         assert response.status_code == 400
 
-    def test_login_success(self, client, test_db):
+    async def test_login_success(self, client, test_db):
         """Test successful login"""
         # Register user first
-        client.post(
+        await client.post(
             "/auth/register",
             json={"username": "testuser", "password": "password123"}
         )
         
         # Login
-        response = client.post(
+        response = await client.post(
             "/auth/login",
             json={"username": "testuser", "password": "password123"}
         )
@@ -116,9 +136,9 @@ class TestAuthEndpoints:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
 
-    def test_login_invalid_credentials(self, client, test_db):
+    async def test_login_invalid_credentials(self, client, test_db):
         """Test login with invalid credentials"""
-        response = client.post(
+        response = await client.post(
             "/auth/login",
             json={"username": "nonexistent", "password": "wrongpass"}
         )
@@ -129,9 +149,9 @@ class TestAuthEndpoints:
 class TestPositionEndpoints:
     """Test position endpoints"""
 
-    def test_create_position_success(self, client, auth_token, test_db):
+    async def test_create_position_success(self, client, auth_token, test_db):
         """Test successful position creation"""
-        response = client.post(
+        response = await client.post(
             "/positions/",
             json={"position_name": "Software Engineer"},
             headers={"Authorization": auth_token}
@@ -142,20 +162,20 @@ class TestPositionEndpoints:
         assert data["position_name"] == "Software Engineer"
         assert "position_id" in data
 
-    def test_create_position_unauthorized(self, client, test_db):
+    async def test_create_position_unauthorized(self, client, test_db):
         """Test position creation without auth"""
-        response = client.post(
+        response = await client.post(
             "/positions/",
             json={"position_name": "Software Engineer"}
         )
         
         assert response.status_code == 403
 
-    def test_get_position_success(self, client, auth_token, test_position, test_db):
+    async def test_get_position_success(self, client, auth_token, test_position, test_db):
         """Test successful position retrieval"""
         position_id = test_position["position_id"]
         
-        response = client.get(
+        response = await client.get(
             f"/positions/{position_id}",
             headers={"Authorization": auth_token}
         )
@@ -165,34 +185,34 @@ class TestPositionEndpoints:
         assert data["position_id"] == position_id
         assert data["position_name"] == "Test Developer"
 
-    def test_get_position_not_found(self, client, auth_token, test_db):
+    async def test_get_position_not_found(self, client, auth_token, test_db):
         """Test position retrieval when not found"""
         non_existent_id = str(uuid4())
         
-        response = client.get(
+        response = await client.get(
             f"/positions/{non_existent_id}",
             headers={"Authorization": auth_token}
         )
         
         assert response.status_code == 404
 
-    def test_get_all_positions(self, client, auth_token, test_position, test_db):
+    async def test_get_all_positions(self, client, auth_token, test_position, test_db):
         """Test getting all positions"""
-        response = client.get(
+        response = await client.get(
             "/positions/",
             headers={"Authorization": auth_token}
         )
         
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
+        assert data == [test_position]
 
-    def test_update_position_success(self, client, auth_token, test_position, test_db):
+    async def test_update_position_success(self, client, auth_token, test_position, test_db):
         """Test successful position update"""
         position_id = test_position["position_id"]
         
-        response = client.put(
+        response = await client.put(
             f"/positions/{position_id}",
             json={"position_name": "Senior Developer"},
             headers={"Authorization": auth_token}
@@ -202,24 +222,40 @@ class TestPositionEndpoints:
         data = response.json()
         assert data["position_name"] == "Senior Developer"
 
-    def test_delete_position_success(self, client, auth_token, test_position, test_db):
+    async def test_delete_position_success(self, client, auth_token, test_position, test_db):
         """Test successful position deletion"""
         position_id = test_position["position_id"]
         
-        response = client.delete(
+        response = await client.delete(
             f"/positions/{position_id}",
             headers={"Authorization": auth_token}
         )
         
         assert response.status_code == 204
 
+    async def test_delete_position_with_employees(self, client, auth_token, test_position, test_db):
+        """Test a position still assigned to employees can't be deleted"""
+        position_id = test_position["position_id"]
+        await client.post(
+            "/employees/",
+            json={"name": "John Doe", "position_id": position_id},
+            headers={"Authorization": auth_token}
+        )
+
+        response = await client.delete(
+            f"/positions/{position_id}",
+            headers={"Authorization": auth_token}
+        )
+
+        assert response.status_code == 409
+
 
 class TestEmployeeEndpoints:
     """Test employee endpoints"""
 
-    def test_create_employee_success(self, client, auth_token, test_position, test_db):
+    async def test_create_employee_success(self, client, auth_token, test_position, test_db):
         """Test successful employee creation"""
-        response = client.post(
+        response = await client.post(
             "/employees/",
             json={
                 "name": "John Doe",
@@ -234,11 +270,11 @@ class TestEmployeeEndpoints:
         assert data["position_id"] == test_position["position_id"]
         assert data["position_name"] == "Test Developer"
 
-    def test_create_employee_invalid_position(self, client, auth_token, test_db):
+    async def test_create_employee_invalid_position(self, client, auth_token, test_db):
         """Test employee creation with invalid position"""
         non_existent_position_id = str(uuid4())
         
-        response = client.post(
+        response = await client.post(
             "/employees/",
             json={
                 "name": "John Doe",
@@ -249,9 +285,31 @@ class TestEmployeeEndpoints:
         
         assert response.status_code == 400
 
-    def test_create_employee_unauthorized(self, client, test_position, test_db):
+    async def test_create_employee_after_position_changes(self, client, auth_token, test_position, test_db):
+        """Test employee writes see position changes, not the read cache"""
+        position_id = test_position["position_id"]
+        headers = {"Authorization": auth_token}
+        employee = {"name": "John Doe", "position_id": position_id}
+
+        # Cache the position, then change it behind the cache's back, as
+        # another worker would
+        await client.get(f"/positions/{position_id}", headers=headers)
+        async with db_connection.get_connection() as db:
+            await db.execute(
+                "UPDATE positions SET position_name = 'Senior Developer'"
+            )
+            await db.commit()
+        response = await client.post("/employees/", json=employee, headers=headers)
+        assert response.json()["position_name"] == "Senior Developer"
+
+        async with db_connection.get_connection() as db:
+            await db.executescript("DELETE FROM employees; DELETE FROM positions;")
+        response = await client.post("/employees/", json=employee, headers=headers)
+        assert response.status_code == 400
+
+    async def test_create_employee_unauthorized(self, client, test_position, test_db):
         """Test employee creation without auth"""
-        response = client.post(
+        response = await client.post(
             "/employees/",
             json={
                 "name": "John Doe",
@@ -261,10 +319,10 @@ class TestEmployeeEndpoints:
         
         assert response.status_code == 403
 
-    def test_get_employee_success(self, client, auth_token, test_position, test_db):
+    async def test_get_employee_success(self, client, auth_token, test_position, test_db):
         """Test successful employee retrieval"""
         # Create employee first
-        create_response = client.post(
+        create_response = await client.post(
             "/employees/",
             json={
                 "name": "Jane Doe",
@@ -275,7 +333,7 @@ class TestEmployeeEndpoints:
         employee = create_response.json()
         
         # Get employee
-        response = client.get(
+        response = await client.get(
             f"/employees/{employee['emp_id']}",
             headers={"Authorization": auth_token}
         )
@@ -285,21 +343,21 @@ class TestEmployeeEndpoints:
         assert data["name"] == "Jane Doe"
         assert data["position_name"] == "Test Developer"
 
-    def test_get_employee_not_found(self, client, auth_token, test_db):
+    async def test_get_employee_not_found(self, client, auth_token, test_db):
         """Test employee retrieval when not found"""
         non_existent_id = str(uuid4())
         
-        response = client.get(
+        response = await client.get(
             f"/employees/{non_existent_id}",
             headers={"Authorization": auth_token}
         )
         
         assert response.status_code == 404
 
-    def test_get_all_employees(self, client, auth_token, test_position, test_db):
+    async def test_get_all_employees(self, client, auth_token, test_position, test_db):
         """Test getting all employees"""
         # Create employee first
-        client.post(
+        await client.post(
             "/employees/",
             json={
                 "name": "Test Employee",
@@ -308,7 +366,7 @@ class TestEmployeeEndpoints:
             headers={"Authorization": auth_token}
         )
         
-        response = client.get(
+        response = await client.get(
             "/employees/",
             headers={"Authorization": auth_token}
         )
@@ -318,10 +376,10 @@ class TestEmployeeEndpoints:
         assert isinstance(data, list)
         assert len(data) >= 1
 
-    def test_update_employee_success(self, client, auth_token, test_position, test_db):
+    async def test_update_employee_success(self, client, auth_token, test_position, test_db):
         """Test successful employee update"""
         # Create employee first
-        create_response = client.post(
+        create_response = await client.post(
             "/employees/",
             json={
                 "name": "Original Name",
@@ -332,7 +390,7 @@ class TestEmployeeEndpoints:
         employee = create_response.json()
         
         # Update employee
-        response = client.put(
+        response = await client.put(
             f"/employees/{employee['emp_id']}",
             json={"name": "Updated Name"},
             headers={"Authorization": auth_token}
@@ -342,10 +400,10 @@ class TestEmployeeEndpoints:
         data = response.json()
         assert data["name"] == "Updated Name"
 
-    def test_delete_employee_success(self, client, auth_token, test_position, test_db):
+    async def test_delete_employee_success(self, client, auth_token, test_position, test_db):
         """Test successful employee deletion"""
         # Create employee first
-        create_response = client.post(
+        create_response = await client.post(
             "/employees/",
             json={
                 "name": "To Be Deleted",
@@ -356,28 +414,50 @@ class TestEmployeeEndpoints:
         employee = create_response.json()
         
         # Delete employee
-        response = client.delete(
+        response = await client.delete(
             f"/employees/{employee['emp_id']}",
             headers={"Authorization": auth_token}
         )
         
         assert response.status_code == 204
 
+    async def test_concurrent_employee_creation(self, client, auth_token, test_position, test_db):
+        """Test concurrent requests against the shared connection"""
+        responses = await asyncio.gather(*(
+            client.post(
+                "/employees/",
+                json={
+                    "name": f"Employee {i}",
+                    "position_id": test_position["position_id"]
+                },
+                headers={"Authorization": auth_token}
+            )
+            for i in range(10)
+        ))
+
+        assert [r.status_code for r in responses] == [201] * 10
+
+        response = await client.get(
+            "/employees/",
+            headers={"Authorization": auth_token}
+        )
+        assert len(response.json()) == 10
+
 
 class TestHealthEndpoints:
     """Test health check endpoints"""
 
-    def test_root_endpoint(self, client):
+    async def test_root_endpoint(self, client):
         """Test root endpoint"""
-        response = client.get("/")
+        response = await client.get("/")
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_health_check_endpoint(self, client):
+    async def test_health_check_endpoint(self, client):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = await client.get("/health")
         
         assert response.status_code == 200
         data = response.json()
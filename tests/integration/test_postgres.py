@@ -0,0 +1,91 @@
+import os
+import pytest
+import pytest_asyncio
+from uuid import uuid4
+
+# Runs against a real server only when a throwaway database is provided; the
+# tables in it are emptied after every test.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+pytest.importorskip("asyncpg")
+
+from src.infrastructure.postgres import (
+    PostgresConnection,
+    PostgresEmployeeRepository,
+    PostgresPositionRepository,
+    PostgresAuthRepository,
+)
+from src.domain.entities import Employee, Position
+
+
+@pytest_asyncio.fixture(scope="module")
+async def pg_db():
+    """Open one pool against the test database for the whole module"""
+    db = PostgresConnection(TEST_DATABASE_URL, min_size=1, max_size=5)
+    await db.initialize()
+    yield db
+    await db.close()
+
+
+@pytest_asyncio.fixture
+async def pg_txn(pg_db):
+    """Give a test the database and empty its tables afterwards"""
+    yield pg_db
+    async with pg_db.get_connection() as db:
+        await db.execute("TRUNCATE users, positions, employees")
+
+
+class TestPostgresRepositories:
+    """Test the Postgres repositories against a live server"""
+
+    async def test_position_crud(self, pg_txn):
+        """Test creating, reading, updating and deleting a position"""
+        repo = PostgresPositionRepository(pg_txn)
+        position = await repo.create(Position(position_id=uuid4(), position_name="Developer"))
+
+        assert await repo.get_by_id(position.position_id) == position
+        assert [p async for p in repo.iter_all()] == [position]
+
+        renamed = Position(position_id=position.position_id, position_name="Lead")
+        assert await repo.update(renamed) == renamed
+        assert await repo.delete(position.position_id) is True
+        assert await repo.delete(position.position_id) is False
+        assert await repo.get_by_id(position.position_id) is None
+
+    async def test_employee_with_position(self, pg_txn):
+        """Test employees are joined to their positions"""
+        position = await PostgresPositionRepository(pg_txn).create(
+            Position(position_id=uuid4(), position_name="Developer")
+        )
+        repo = PostgresEmployeeRepository(pg_txn)
+        employee = await repo.create(
+            Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id)
+        )
+
+        found = await repo.get_with_position(employee.emp_id)
+
+        assert found.name == "John Doe"
+        assert found.position == position
+        assert [e.emp_id for e in await repo.get_all_with_positions()] == [employee.emp_id]
+
+    async def test_foreign_key_enforced(self, pg_txn):
+        """Test employees can't point at missing or deleted positions"""
+        positions = PostgresPositionRepository(pg_txn)
+        position = await positions.create(Position(position_id=uuid4(), position_name="Developer"))
+        repo = PostgresEmployeeRepository(pg_txn)
+        await repo.create(Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id))
+
+        with pytest.raises(ValueError, match="Position not found"):
+            await repo.create(Employee(emp_id=uuid4(), name="Orphan", position_id=uuid4()))
+        with pytest.raises(ValueError, match="assigned to employees"):
+            await positions.delete(position.position_id)
+
+    async def test_create_and_verify_user(self, pg_txn):
+        """Test registering and verifying a user"""
+        repo = PostgresAuthRepository(pg_txn)
+
+        assert await repo.create_user("testuser", "secret") is True
+        assert await repo.create_user("testuser", "secret") is False
+        assert await repo.verify_user("testuser", "secret") is True
+        assert await repo.verify_user("testuser", "wrong") is False
@@ -0,0 +1,29 @@
+import pytest_asyncio
+from src.infrastructure.database import DatabaseConnection
+
+
+@pytest_asyncio.fixture(scope="session")
+async def temp_db():
+    """Create one in-memory database for the whole session
+
+    DatabaseConnection keeps a single connection, so every repository sees
+    the same in-memory database until it is closed.
+    """
+    db = DatabaseConnection(":memory:")
+    await db.initialize()
+    yield db
+    await db.close()
+
+
+@pytest_asyncio.fixture
+async def db_txn(temp_db):
+    """Give a test the shared database and empty its tables afterwards
+
+    Repositories commit their own transactions, which would release an
+    enclosing SAVEPOINT, so isolation comes from deleting rows instead.
+    """
+    yield temp_db
+    async with temp_db.get_connection() as db:
+        await db.executescript(
+            "DELETE FROM users; DELETE FROM employees; DELETE FROM positions;"
+        )
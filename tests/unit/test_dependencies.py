@@ -0,0 +1,128 @@
+import os
+import pytest
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from src.interface import dependencies
+from src.interface.dependencies import get_current_user, jwt_service
+
+
+class TestDatabaseSelection:
+    """Test choosing the database backend from DATABASE_URL"""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            (None, False),
+            ("", False),
+            ("employees.db", False),
+            ("sqlite:///employees.db", False),
+            ("postgres://user@localhost/employees", True),
+            ("postgresql://user:pw@localhost:5432/employees", True),
+        ],
+    )
+    def test_is_postgres_url(self, url, expected):
+        """Test only postgres DSNs select the PostgreSQL backend"""
+        assert dependencies._is_postgres_url(url) is expected
+
+    def test_postgres_url_wires_postgres_repositories(self):
+        """Test a postgres DATABASE_URL swaps in the Postgres classes at import"""
+        pytest.importorskip("asyncpg")
+        code = (
+            "from src.interface import dependencies as d; "
+            "print(type(d.db_connection).__name__, type(d.base_position_repository).__name__)"
+        )
+        # The pool is only opened by initialize(), so no server is needed
+        env = {**os.environ, "DATABASE_URL": "postgresql://user@localhost/employees"}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, env=env, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        )
+
+        assert result.stdout.split() == ["PostgresConnection", "PostgresPositionRepository"]
+
+    @pytest.mark.parametrize("use_postgres, expected", [(False, 1), (True, 8)])
+    def test_default_workers(self, monkeypatch, use_postgres, expected):
+        """Test SQLite runs one worker and PostgreSQL one per CPU"""
+        import main
+
+        monkeypatch.setattr(main, "USE_POSTGRES", use_postgres)
+        monkeypatch.setattr(os, "cpu_count", lambda: 8)
+
+        assert main.default_workers() == expected
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestGetCurrentUser:
+    """Test get_current_user dependency"""
+
+    @pytest.fixture(autouse=True)
+    def clear_token_cache(self):
+        dependencies._token_cache.clear()
+        yield
+        dependencies._token_cache.clear()
+
+    async def test_valid_token_returns_username(self):
+        """Test a valid token resolves to its subject"""
+        token = jwt_service.create_access_token({"sub": "testuser"})
+
+        assert await get_current_user(_credentials(token)) == "testuser"
+
+    async def test_repeated_token_verified_once(self):
+        """Test verification results are cached per token"""
+        token = jwt_service.create_access_token({"sub": "testuser"})
+
+        with patch.object(jwt_service, "verify_token", wraps=jwt_service.verify_token) as verify:
+            await get_current_user(_credentials(token))
+            await get_current_user(_credentials(token))
+
+        verify.assert_called_once_with(token)
+
+    async def test_cache_does_not_store_raw_token(self):
+        """Test cache keys are token digests"""
+        token = jwt_service.create_access_token({"sub": "testuser"})
+
+        await get_current_user(_credentials(token))
+
+        assert token not in dependencies._token_cache
+        assert all(isinstance(key, bytes) for key in dependencies._token_cache)
+
+    async def test_expired_cached_token_rejected(self):
+        """Test a cached payload is not served past its exp"""
+        token = jwt_service.create_access_token({"sub": "testuser"})
+        await get_current_user(_credentials(token))
+
+        later = time.time() + 2 * 24 * 60 * 60
+        with patch.object(time, "time", return_value=later), patch.object(
+            jwt_service, "verify_token", return_value=None
+        ) as verify:
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(_credentials(token))
+
+        assert exc_info.value.status_code == 401
+        verify.assert_called_once_with(token)
+
+    async def test_invalid_token_not_cached(self):
+        """Test failed verifications are not cached"""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(_credentials("invalid.token.here"))
+
+        assert exc_info.value.status_code == 401
+        assert len(dependencies._token_cache) == 0
+
+    async def test_token_without_subject_rejected(self):
+        """Test a valid token with no sub claim is rejected"""
+        token = jwt_service.create_access_token({"role": "admin"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(_credentials(token))
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.headers == {"WWW-Authenticate": "Bearer"}
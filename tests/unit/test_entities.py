@@ -1,15 +1,18 @@
 import pytest
+from dataclasses import FrozenInstanceError
 from uuid import uuid4
 from src.domain.entities import Employee, Position
 
+EMP_ID, POS_ID = uuid4(), uuid4()
+
 
 class TestEmployee:
     """Test Employee entity"""
 
     def test_employee_creation_valid(self):
         """Test valid employee creation"""
-        emp_id = uuid4()
-        position_id = uuid4()
+        emp_id = EMP_ID
+        position_id = POS_ID
         employee = Employee(emp_id=emp_id, name="John Doe", position_id=position_id)
         
         assert employee.emp_id == emp_id
@@ -19,8 +22,8 @@ class TestEmployee:
 
     def test_employee_creation_with_position(self):
         """Test employee creation with position"""
-        emp_id = uuid4()
-        position_id = uuid4()
+        emp_id = EMP_ID
+        position_id = POS_ID
         position = Position(position_id=position_id, position_name="Developer")
         employee = Employee(
             emp_id=emp_id, 
@@ -34,12 +37,25 @@ class TestEmployee:
     def test_employee_empty_name_raises_error(self):
         """Test that empty name raises ValueError"""
         with pytest.raises(ValueError, match="Employee name cannot be empty"):
-            Employee(emp_id=uuid4(), name="", position_id=uuid4())
+            Employee(emp_id=EMP_ID, name="", position_id=POS_ID)
+
+    def test_employee_has_no_instance_dict(self):
+        """Test that employees use slots instead of a per-instance __dict__"""
+        employee = Employee(emp_id=EMP_ID, name="John Doe", position_id=POS_ID)
+
+        assert not hasattr(employee, "__dict__")
+
+    def test_employee_is_immutable(self):
+        """Test that employee fields cannot be reassigned"""
+        employee = Employee(emp_id=EMP_ID, name="John Doe", position_id=POS_ID)
+
+        with pytest.raises(FrozenInstanceError):
+            employee.name = "Jane Doe"
 
     def test_employee_whitespace_name_raises_error(self):
         """Test that whitespace-only name raises ValueError"""
         with pytest.raises(ValueError, match="Employee name cannot be empty"):
-            Employee(emp_id=uuid4(), name="   ", position_id=uuid4())
+            Employee(emp_id=EMP_ID, name="   ", position_id=POS_ID)
 
 
 class TestPosition:
@@ -47,7 +63,7 @@ class TestPosition:
 
     def test_position_creation_valid(self):
         """Test valid position creation"""
-        position_id = uuid4()
+        position_id = POS_ID
         position = Position(position_id=position_id, position_name="Developer")
         
         assert position.position_id == position_id
@@ -56,9 +72,9 @@ class TestPosition:
     def test_position_empty_name_raises_error(self):
         """Test that empty position name raises ValueError"""
         with pytest.raises(ValueError, match="Position name cannot be empty"):
-            Position(position_id=uuid4(), position_name="")
+            Position(position_id=POS_ID, position_name="")
 
     def test_position_whitespace_name_raises_error(self):
         """Test that whitespace-only position name raises ValueError"""
         with pytest.raises(ValueError, match="Position name cannot be empty"):
-            Position(position_id=uuid4(), position_name="   ")
\ No newline at end of file
+            Position(position_id=POS_ID, position_name="   ")
\ No newline at end of file
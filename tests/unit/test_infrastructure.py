@@ -1,31 +1,29 @@
 import pytest
 import pytest_asyncio
-import tempfile
-import os
+import sqlite3
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock
 from uuid import uuid4
 from src.infrastructure.database import (
     DatabaseConnection,
     SQLiteEmployeeRepository,
     SQLitePositionRepository,
 )
-from src.infrastructure.auth import SQLiteAuthRepository, JWTService
+from src.infrastructure.auth import (
+    SQLiteAuthRepository,
+    JWTService,
+    hash_password,
+    verify_password,
+)
+from src.infrastructure.cache import CachedPositionRepository
+from src.infrastructure.queries import employee_with_position
 from src.domain.entities import Employee, Position
 
 
 class TestDatabaseConnection:
     """Test database connection"""
 
-    @pytest_asyncio.fixture
-    async def temp_db(self):
-        """Create temporary database for testing"""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db = DatabaseConnection(path)
-        await db.initialize()
-        yield db
-        os.unlink(path)
-
-    @pytest.mark.asyncio
     async def test_database_initialization(self, temp_db):
         """Test database table creation"""
         async with temp_db.get_connection() as conn:
@@ -39,24 +37,165 @@ class TestDatabaseConnection:
             assert "positions" in tables
             assert "users" in tables
 
+    async def test_employee_position_index(self, temp_db):
+        """Test the employees.position_id index is created"""
+        async with temp_db.get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='employees'"
+            )
+            indexes = [row[0] for row in await cursor.fetchall()]
+
+        assert "idx_employees_position_id" in indexes
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT password_hash FROM users WHERE username = ?",
+            "SELECT position_id, position_name FROM positions WHERE position_id = ?",
+            "SELECT emp_id, name, position_id FROM employees WHERE emp_id = ?",
+        ],
+    )
+    async def test_key_lookups_use_index(self, temp_db, query):
+        """Test key lookups are index seeks rather than table scans"""
+        async with temp_db.get_connection() as conn:
+            cursor = await conn.execute(f"EXPLAIN QUERY PLAN {query}", ("key",))
+            plan = " ".join(row[-1] for row in await cursor.fetchall())
+
+        assert "USING" in plan and "INDEX" in plan
+        assert "SCAN" not in plan
+
+    async def test_connection_pragmas(self, tmp_path):
+        """Test the connection PRAGMAs are applied to a file database"""
+        db = DatabaseConnection(str(tmp_path / "pragmas.db"))
+        try:
+            async with db.get_connection() as conn:
+                results = {}
+                for pragma in (
+                    "foreign_keys", "journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store"
+                ):
+                    cursor = await conn.execute(f"PRAGMA {pragma}")
+                    results[pragma] = (await cursor.fetchone())[0]
+        finally:
+            await db.close()
+
+        assert results == {
+            "foreign_keys": 1,
+            "journal_mode": "wal",
+            "synchronous": 1,
+            "cache_size": -65536,
+            "mmap_size": 268435456,
+            "temp_store": 2,
+        }
+
+    async def test_in_memory_database(self):
+        """Test an in-memory database opens without WAL"""
+        db = DatabaseConnection(":memory:")
+        await db.initialize()
+        try:
+            async with db.get_connection() as conn:
+                cursor = await conn.execute("PRAGMA journal_mode")
+                assert (await cursor.fetchone())[0] == "memory"
+        finally:
+            await db.close()
+
+
+def _create_text_id_database(path, position_id, emp_id):
+    """Create a database in the old format, with ids stored as TEXT"""
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE positions (
+            position_id TEXT PRIMARY KEY,
+            position_name TEXT NOT NULL
+        );
+        CREATE TABLE employees (
+            emp_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            position_id TEXT NOT NULL,
+            FOREIGN KEY (position_id) REFERENCES positions (position_id)
+        );
+        """
+    )
+    conn.execute("INSERT INTO positions VALUES (?, ?)", (position_id, "Developer"))
+    conn.execute("INSERT INTO employees VALUES (?, ?, ?)", (emp_id, "John Doe", position_id))
+    conn.commit()
+    conn.close()
+
+
+class TestTextIdMigration:
+    """Test migrating databases created with TEXT id columns"""
+
+    async def test_text_ids_migrated_to_uuid(self, tmp_path):
+        """Test existing rows stay readable by id after initialize()"""
+        path = str(tmp_path / "old.db")
+        position_id, emp_id = uuid4(), uuid4()
+        _create_text_id_database(path, str(position_id), str(emp_id))
 
-class TestSQLitePositionRepository:
-    """Test SQLite position repository"""
+        db = DatabaseConnection(path)
+        try:
+            await db.initialize()
+            await db.initialize()  # already migrated: a no-op
+            employee = await SQLiteEmployeeRepository(db).get_with_position(emp_id)
+            async with db.get_connection() as conn:
+                cursor = await conn.execute("PRAGMA table_info(employees)")
+                types = {row[1]: row[2] for row in await cursor.fetchall()}
+                cursor = await conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='employees'"
+                )
+                indexes = [row[0] for row in await cursor.fetchall()]
+        finally:
+            await db.close()
+
+        assert employee.emp_id == emp_id
+        assert employee.position == Position(position_id=position_id, position_name="Developer")
+        assert types["emp_id"] == "UUID" and types["position_id"] == "UUID"
+        assert "idx_employees_position_id" in indexes
+
+    async def test_invalid_text_id_aborts_migration(self, tmp_path):
+        """Test a non-UUID id raises and leaves the old table in place"""
+        path = str(tmp_path / "old.db")
+        _create_text_id_database(path, "not-a-uuid", str(uuid4()))
 
-    @pytest_asyncio.fixture
-    async def temp_db(self):
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
         db = DatabaseConnection(path)
-        await db.initialize()
-        yield db
-        os.unlink(path)
+        try:
+            with pytest.raises(RuntimeError, match="positions.position_id"):
+                await db.initialize()
+        finally:
+            await db.close()
+
+        conn = sqlite3.connect(path)
+        rows = conn.execute("SELECT position_id FROM positions").fetchall()
+        conn.close()
+        assert rows == [("not-a-uuid",)]
+
+
+class TestEmployeeWithPosition:
+    """Test mapping joined employee/position rows"""
+
+    def test_row_with_position(self):
+        """Test a joined row builds the employee and its position"""
+        emp_id, position_id = uuid4(), uuid4()
+
+        employee = employee_with_position((emp_id, "John Doe", position_id, "Developer"))
+
+        assert employee.emp_id == emp_id
+        assert employee.name == "John Doe"
+        assert employee.position == Position(position_id=position_id, position_name="Developer")
+
+    def test_row_without_position(self):
+        """Test a row with no matching position leaves position unset"""
+        employee = employee_with_position((uuid4(), "Orphan", uuid4(), None))
+
+        assert employee.position is None
+
+
+class TestSQLitePositionRepository:
+    """Test SQLite position repository"""
 
     @pytest.fixture
-    def position_repo(self, temp_db):
-        return SQLitePositionRepository(temp_db)
+    def position_repo(self, db_txn):
+        return SQLitePositionRepository(db_txn)
 
-    @pytest.mark.asyncio
     async def test_create_position(self, position_repo):
         """Test position creation"""
         position = Position(position_id=uuid4(), position_name="Developer")
@@ -66,7 +205,6 @@ class TestSQLitePositionRepository:
         assert created.position_id == position.position_id
         assert created.position_name == position.position_name
 
-    @pytest.mark.asyncio
     async def test_get_position_by_id(self, position_repo):
         """Test position retrieval by ID"""
         position = Position(position_id=uuid4(), position_name="Developer")
@@ -78,7 +216,6 @@ class TestSQLitePositionRepository:
         assert retrieved.position_id == position.position_id
         assert retrieved.position_name == position.position_name
 
-    @pytest.mark.asyncio
     async def test_get_position_not_found(self, position_repo):
         """Test position retrieval when not found"""
         non_existent_id = uuid4()
@@ -87,14 +224,12 @@ class TestSQLitePositionRepository:
         
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_all_positions(self, position_repo):
         """Test getting all positions"""
         position1 = Position(position_id=uuid4(), position_name="Developer")
         position2 = Position(position_id=uuid4(), position_name="Manager")
         
-        await position_repo.create(position1)
-        await position_repo.create(position2)
+        await position_repo.create_many([position1, position2])
         
         positions = await position_repo.get_all()
         
@@ -103,28 +238,58 @@ class TestSQLitePositionRepository:
         assert "Developer" in position_names
         assert "Manager" in position_names
 
+    async def test_create_many_positions(self, position_repo):
+        """Test bulk position creation"""
+        positions = [
+            Position(position_id=uuid4(), position_name="Developer"),
+            Position(position_id=uuid4(), position_name="Manager"),
+        ]
+
+        created = await position_repo.create_many(positions)
+
+        assert created == positions
+        assert len(await position_repo.get_all()) == 2
+
+    async def test_iter_all_positions_in_chunks(self, position_repo):
+        """Test streaming positions across several chunks in insertion order"""
+        positions = [
+            Position(position_id=uuid4(), position_name=f"Position {i}") for i in range(5)
+        ]
+        await position_repo.create_many(positions)
+
+        streamed = [p async for p in position_repo.iter_all(chunk_size=2)]
+
+        assert streamed == positions
+
+    async def test_create_many_positions_is_atomic(self, position_repo):
+        """Test a failing bulk insert leaves no rows behind"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await position_repo.create_many([position, position])
+
+        assert await position_repo.get_all() == []
+
+    async def test_update_and_delete_position_not_found(self, position_repo):
+        """Test update/delete of a missing row after earlier writes on the connection"""
+        await position_repo.create(Position(position_id=uuid4(), position_name="Developer"))
+        missing = Position(position_id=uuid4(), position_name="Manager")
+
+        assert await position_repo.update(missing) is None
+        assert await position_repo.delete(missing.position_id) is False
+
 
 class TestSQLiteEmployeeRepository:
     """Test SQLite employee repository"""
 
-    @pytest_asyncio.fixture
-    async def temp_db(self):
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db = DatabaseConnection(path)
-        await db.initialize()
-        yield db
-        os.unlink(path)
-
     @pytest.fixture
-    def employee_repo(self, temp_db):
-        return SQLiteEmployeeRepository(temp_db)
+    def employee_repo(self, db_txn):
+        return SQLiteEmployeeRepository(db_txn)
 
     @pytest.fixture
-    def position_repo(self, temp_db):
-        return SQLitePositionRepository(temp_db)
+    def position_repo(self, db_txn):
+        return SQLitePositionRepository(db_txn)
 
-    @pytest.mark.asyncio
     async def test_create_employee(self, employee_repo, position_repo):
         """Test employee creation"""
         # Create position first
@@ -143,7 +308,6 @@ class TestSQLiteEmployeeRepository:
         assert created.name == employee.name
         assert created.position_id == employee.position_id
 
-    @pytest.mark.asyncio
     async def test_get_employee_by_id(self, employee_repo, position_repo):
         """Test employee retrieval by ID"""
         # Create position first
@@ -164,94 +328,279 @@ class TestSQLiteEmployeeRepository:
         assert retrieved.name == employee.name
         assert retrieved.position_id == employee.position_id
 
+    async def test_create_many_employees(self, employee_repo, position_repo):
+        """Test bulk employee creation"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        await position_repo.create(position)
+        employees = [
+            Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id),
+            Employee(emp_id=uuid4(), name="Jane Doe", position_id=position.position_id),
+        ]
+
+        created = await employee_repo.create_many(employees)
+
+        assert created == employees
+        names = sorted(e.name for e in await employee_repo.get_all())
+        assert names == ["Jane Doe", "John Doe"]
+
+    async def test_get_with_position(self, employee_repo, position_repo):
+        """Test employee retrieval joined with its position"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        await position_repo.create(position)
+        employee = Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id)
+        await employee_repo.create(employee)
+
+        retrieved = await employee_repo.get_with_position(employee.emp_id)
+
+        assert retrieved is not None
+        assert retrieved.emp_id == employee.emp_id
+        assert retrieved.position == position
+        assert await employee_repo.get_with_position(uuid4()) is None
+
+    async def test_get_all_with_positions(self, employee_repo, position_repo):
+        """Test listing employees joined with their positions"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        await position_repo.create(position)
+        employee = Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id)
+        await employee_repo.create(employee)
+
+        employees = await employee_repo.get_all_with_positions()
+
+        assert [e.emp_id for e in employees] == [employee.emp_id]
+        assert employees[0].position == position
+
+    async def test_unknown_position_rejected(self, employee_repo, position_repo):
+        """Test the foreign key rejects employees pointing at no position"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        await position_repo.create(position)
+        employee = Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id)
+        await employee_repo.create(employee)
+
+        with pytest.raises(ValueError, match="Position not found"):
+            await employee_repo.create(Employee(emp_id=uuid4(), name="Orphan", position_id=uuid4()))
+        with pytest.raises(ValueError, match="Position not found"):
+            await employee_repo.update(Employee(
+                emp_id=employee.emp_id, name="John Doe", position_id=uuid4()
+            ))
+        with pytest.raises(ValueError, match="assigned to employees"):
+            await position_repo.delete(position.position_id)
+        assert await employee_repo.get_all() == [employee]
+
+    async def test_ids_stored_as_16_byte_blobs(self, temp_db, employee_repo, position_repo):
+        """Test UUID columns hold the binary form, not 36-char text"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        await position_repo.create(position)
+        employee = Employee(emp_id=uuid4(), name="John Doe", position_id=position.position_id)
+        await employee_repo.create(employee)
+
+        async with temp_db.get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT typeof(emp_id), length(emp_id), typeof(position_id), "
+                "length(position_id) FROM employees"
+            )
+            row = await cursor.fetchone()
+
+        assert tuple(row) == ("blob", 16, "blob", 16)
+
 
 class TestJWTService:
     """Test JWT service"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def jwt_service(self):
         return JWTService("test_secret_key")
 
-    def test_create_access_token(self, jwt_service):
+    @pytest.fixture(scope="module")
+    def sample_token(self, jwt_service):
+        return jwt_service.create_access_token({"sub": "testuser"})
+
+    def test_create_access_token(self, sample_token):
         """Test token creation"""
-        data = {"sub": "testuser"}
-        token = jwt_service.create_access_token(data)
-        
-        assert token is not None
-        assert isinstance(token, str)
+        assert sample_token is not None
+        assert isinstance(sample_token, str)
 
-    def test_verify_token_valid(self, jwt_service):
+    def test_verify_token_valid(self, jwt_service, sample_token):
         """Test valid token verification"""
-        data = {"sub": "testuser"}
-        token = jwt_service.create_access_token(data)
-        
-        payload = jwt_service.verify_token(token)
+        payload = jwt_service.verify_token(sample_token)
         
         assert payload is not None
         assert payload["sub"] == "testuser"
 
-    def test_verify_token_invalid(self, jwt_service):
+    def test_token_expires_in_24_hours_by_default(self, jwt_service):
+        """Test default expiry is an integer epoch timestamp 24h ahead"""
+        before = int(time.time())
+        payload = jwt_service.verify_token(jwt_service.create_access_token({"sub": "testuser"}))
+
+        assert isinstance(payload["exp"], int)
+        assert before + 24 * 60 * 60 <= payload["exp"] <= int(time.time()) + 24 * 60 * 60
+
+    def test_verify_token_expired(self, jwt_service):
+        """Test expired token verification"""
+        token = jwt_service.create_access_token(
+            {"sub": "testuser"}, expires_delta=timedelta(seconds=-1)
+        )
+
+        assert jwt_service.verify_token(token) is None
+
+    def test_verify_token_wrong_secret(self, jwt_service):
+        """Test token signed with another secret is rejected"""
+        token = JWTService("other_secret").create_access_token({"sub": "testuser"})
+
+        assert jwt_service.verify_token(token) is None
+
+    @pytest.mark.parametrize(
+        "invalid_token", ["invalid.token.here", "", "a.b", "x." * 3, "not-a-jwt"]
+    )
+    def test_verify_token_invalid(self, jwt_service, invalid_token):
         """Test invalid token verification"""
-        invalid_token = "invalid.token.here"
-        
         payload = jwt_service.verify_token(invalid_token)
         
         assert payload is None
 
 
+class TestPasswordHashing:
+    """Test bcrypt password hashing
+
+    Imported directly, so these always use real bcrypt even while the
+    repositories run with the fast test hasher.
+    """
+
+    def test_hash_and_verify(self):
+        """Test a hash verifies only its own password"""
+        hashed = hash_password("password")
+
+        assert hashed.startswith("$2b$")
+        assert verify_password("password", hashed) is True
+        assert verify_password("wrongpassword", hashed) is False
+
+
 class TestSQLiteAuthRepository:
     """Test SQLite auth repository"""
 
-    @pytest_asyncio.fixture
-    async def temp_db(self):
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db = DatabaseConnection(path)
-        await db.initialize()
-        yield db
-        os.unlink(path)
-
     @pytest.fixture
-    def auth_repo(self, temp_db):
-        return SQLiteAuthRepository(temp_db)
+    def auth_repo(self, db_txn):
+        return SQLiteAuthRepository(db_txn)
+
+    @pytest_asyncio.fixture
+    async def seeded_auth_repo(self, auth_repo):
+        """Auth repository with "testuser"/"password" already registered"""
+        await auth_repo.create_user("testuser", "password")
+        return auth_repo
 
-    @pytest.mark.asyncio
     async def test_create_user(self, auth_repo):
         """Test user creation"""
         result = await auth_repo.create_user("testuser", "password")
         
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_create_duplicate_user(self, auth_repo):
+    @pytest.mark.parametrize("password", ["password", "otherpassword"])
+    async def test_create_duplicate_user(self, seeded_auth_repo, password):
         """Test creating duplicate user fails"""
-        await auth_repo.create_user("testuser", "password")
-        
-        result = await auth_repo.create_user("testuser", "password")
+        result = await seeded_auth_repo.create_user("testuser", password)
         
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_verify_user_valid(self, auth_repo):
+    async def test_verify_user_valid(self, seeded_auth_repo):
         """Test valid user verification"""
-        await auth_repo.create_user("testuser", "password")
-        
-        result = await auth_repo.verify_user("testuser", "password")
+        result = await seeded_auth_repo.verify_user("testuser", "password")
         
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_verify_user_invalid_password(self, auth_repo):
-        """Test invalid password verification"""
-        await auth_repo.create_user("testuser", "password")
-        
-        result = await auth_repo.verify_user("testuser", "wrongpassword")
+    @pytest.mark.parametrize(
+        "username, password",
+        [
+            ("testuser", "wrongpassword"),
+            ("testuser", ""),
+            ("nonexistent", "password"),
+        ],
+        ids=["invalid_password", "empty_password", "not_found"],
+    )
+    async def test_verify_user_rejected(self, seeded_auth_repo, username, password):
+        """Test verification with a wrong password or a non-existent user"""
+        result = await seeded_auth_repo.verify_user(username, password)
         
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_verify_user_not_found(self, auth_repo):
-        """Test verification of non-existent user"""
-        result = await auth_repo.verify_user("nonexistent", "password")
-        
-        assert result is False
\ No newline at end of file
+
+class TestCachedPositionRepository:
+    """Test cached position repository"""
+
+    @pytest.fixture
+    def inner_repo(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def cached_repo(self, inner_repo):
+        return CachedPositionRepository(inner_repo)
+
+    async def test_get_by_id_served_from_cache(self, cached_repo, inner_repo):
+        """Test repeated lookups hit the underlying repository once"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        inner_repo.get_by_id.return_value = position
+
+        first = await cached_repo.get_by_id(position.position_id)
+        second = await cached_repo.get_by_id(position.position_id)
+
+        assert first == second == position
+        inner_repo.get_by_id.assert_called_once_with(position.position_id)
+
+    async def test_missing_position_not_cached(self, cached_repo, inner_repo):
+        """Test that not-found results are looked up again"""
+        inner_repo.get_by_id.return_value = None
+        position_id = uuid4()
+
+        assert await cached_repo.get_by_id(position_id) is None
+        assert await cached_repo.get_by_id(position_id) is None
+        assert inner_repo.get_by_id.call_count == 2
+
+    async def test_update_and_delete_invalidate(self, cached_repo, inner_repo):
+        """Test writes drop the cached entry"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        inner_repo.get_by_id.return_value = position
+        await cached_repo.get_by_id(position.position_id)
+
+        await cached_repo.update(position)
+        await cached_repo.get_by_id(position.position_id)
+        await cached_repo.delete(position.position_id)
+        await cached_repo.get_by_id(position.position_id)
+
+        assert inner_repo.get_by_id.call_count == 3
+
+    async def test_entries_expire(self, inner_repo):
+        """Test entries older than the TTL are refreshed"""
+        cached_repo = CachedPositionRepository(inner_repo, ttl=0)
+        position = Position(position_id=uuid4(), position_name="Developer")
+        inner_repo.get_by_id.return_value = position
+
+        await cached_repo.get_by_id(position.position_id)
+        await cached_repo.get_by_id(position.position_id)
+
+        assert inner_repo.get_by_id.call_count == 2
+
+    async def test_maxsize_evicts_oldest(self, inner_repo):
+        """Test the cache stays bounded"""
+        cached_repo = CachedPositionRepository(inner_repo, maxsize=1)
+        first = Position(position_id=uuid4(), position_name="Developer")
+        second = Position(position_id=uuid4(), position_name="Manager")
+        inner_repo.get_by_id.side_effect = [first, second, first]
+
+        await cached_repo.get_by_id(first.position_id)
+        await cached_repo.get_by_id(second.position_id)
+        await cached_repo.get_by_id(first.position_id)
+
+        assert inner_repo.get_by_id.call_count == 3
+
+    async def test_iter_all_passes_chunk_size(self, inner_repo):
+        """Test streaming through the cache keeps the caller's chunk size"""
+        position = Position(position_id=uuid4(), position_name="Developer")
+        chunk_sizes = []
+
+        async def iter_all(chunk_size):
+            chunk_sizes.append(chunk_size)
+            yield position
+
+        inner_repo.iter_all = iter_all
+        cached_repo = CachedPositionRepository(inner_repo)
+
+        assert [p async for p in cached_repo.iter_all(chunk_size=2)] == [position]
+        assert chunk_sizes == [2]
@@ -0,0 +1,119 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+asyncpg = pytest.importorskip("asyncpg")
+
+from src.infrastructure import auth
+from src.infrastructure.postgres import (
+    PostgresAuthRepository,
+    PostgresEmployeeRepository,
+    PostgresPositionRepository,
+    _affected_rows,
+)
+from src.domain.entities import Employee, Position
+
+
+class StubConnection:
+    """Stands in for PostgresConnection, handing out one mocked connection"""
+
+    def __init__(self):
+        self.db = AsyncMock()
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.db
+
+
+@pytest.fixture
+def stub_connection():
+    return StubConnection()
+
+
+class TestAffectedRows:
+    """Test parsing asyncpg command statuses"""
+
+    @pytest.mark.parametrize(
+        "status, expected",
+        [("UPDATE 1", 1), ("DELETE 0", 0), ("INSERT 0 3", 3)],
+    )
+    def test_affected_rows(self, status, expected):
+        """Test the row count is the last field of the status"""
+        assert _affected_rows(status) == expected
+
+
+class TestPostgresEmployeeRepository:
+    """Test Postgres employee repository"""
+
+    async def test_get_with_position_maps_row(self, stub_connection):
+        """Test a joined row becomes an employee with its position"""
+        emp_id, position_id = uuid4(), uuid4()
+        stub_connection.db.fetchrow.return_value = (emp_id, "John Doe", position_id, "Developer")
+        repo = PostgresEmployeeRepository(stub_connection)
+
+        employee = await repo.get_with_position(emp_id)
+
+        assert employee.name == "John Doe"
+        assert employee.position == Position(position_id=position_id, position_name="Developer")
+
+    async def test_unknown_position_rejected(self, stub_connection):
+        """Test a foreign key violation surfaces as ValueError"""
+        stub_connection.db.execute.side_effect = asyncpg.ForeignKeyViolationError("fk")
+        repo = PostgresEmployeeRepository(stub_connection)
+
+        with pytest.raises(ValueError, match="Position not found"):
+            await repo.create(Employee(emp_id=uuid4(), name="Orphan", position_id=uuid4()))
+
+    async def test_delete_missing_employee(self, stub_connection):
+        """Test delete reports False when no row was affected"""
+        stub_connection.db.execute.return_value = "DELETE 0"
+        repo = PostgresEmployeeRepository(stub_connection)
+
+        assert await repo.delete(uuid4()) is False
+
+
+class TestPostgresPositionRepository:
+    """Test Postgres position repository"""
+
+    async def test_update_existing_position(self, stub_connection):
+        """Test update returns the position when a row was affected"""
+        stub_connection.db.execute.return_value = "UPDATE 1"
+        repo = PostgresPositionRepository(stub_connection)
+        position = Position(position_id=uuid4(), position_name="Developer")
+
+        assert await repo.update(position) == position
+
+    async def test_delete_assigned_position_rejected(self, stub_connection):
+        """Test deleting a referenced position surfaces as ValueError"""
+        stub_connection.db.execute.side_effect = asyncpg.ForeignKeyViolationError("fk")
+        repo = PostgresPositionRepository(stub_connection)
+
+        with pytest.raises(ValueError, match="assigned to employees"):
+            await repo.delete(uuid4())
+
+    async def test_get_by_id_maps_row(self, stub_connection):
+        """Test a fetched row becomes a Position"""
+        position_id = uuid4()
+        stub_connection.db.fetchrow.return_value = (position_id, "Developer")
+        repo = PostgresPositionRepository(stub_connection)
+
+        assert await repo.get_by_id(position_id) == Position(
+            position_id=position_id, position_name="Developer"
+        )
+
+
+class TestPostgresAuthRepository:
+    """Test Postgres auth repository"""
+
+    async def test_create_then_verify_user(self, stub_connection):
+        """Test the stored hash is produced and checked by the auth module"""
+        repo = PostgresAuthRepository(stub_connection)
+
+        assert await repo.create_user("testuser", "secret") is True
+        stored_hash = stub_connection.db.execute.call_args.args[-1]
+        assert auth.verify_password("secret", stored_hash)
+
+        stub_connection.db.fetchval.return_value = stored_hash
+        assert await repo.verify_user("testuser", "secret") is True
+        assert await repo.verify_user("testuser", "wrong") is False
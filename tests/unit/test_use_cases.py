@@ -1,6 +1,6 @@
 import pytest
 import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 from uuid import uuid4
 from src.application.use_cases import EmployeeUseCase, PositionUseCase, AuthUseCase
 from src.application.dtos import (
@@ -8,37 +8,111 @@ from src.application.dtos import (
     EmployeeUpdateDTO,
     PositionCreateDTO,
     PositionUpdateDTO,
+    PositionResponseDTO,
     LoginDTO,
     UserCreateDTO,
 )
 from src.domain.entities import Employee, Position
 
+# Fixed IDs for tests where the value doesn't matter; stubs hold no state
+# between tests. "Not found" tests still use a fresh uuid4().
+POS_ID_A, POS_ID_B = uuid4(), uuid4()
+EMP_ID_A, EMP_ID_B, EMP_ID_C = uuid4(), uuid4(), uuid4()
+
+
+class StubEmployeeRepo:
+    """Employee repository stub returning preset results and recording calls"""
+
+    def __init__(self):
+        self.create_result = None
+        self.get_with_position_result = None
+        self.get_all_with_positions_result = []
+        self.create_calls = []
+        self.update_calls = []
+
+    async def create(self, employee):
+        self.create_calls.append(employee)
+        return self.create_result
+
+    async def get_with_position(self, emp_id):
+        return self.get_with_position_result
+
+    async def get_all_with_positions(self):
+        return self.get_all_with_positions_result
+
+    async def update(self, employee):
+        self.update_calls.append(employee)
+        return employee
+
+
+class StubPositionRepo:
+    """Position repository stub returning preset results and recording calls"""
+
+    def __init__(self):
+        self.create_result = None
+        self.get_by_id_result = None
+        self.get_all_result = []
+        self.create_calls = []
+        self.get_by_id_calls = []
+        self.get_all_calls = 0
+
+    async def create(self, position):
+        self.create_calls.append(position)
+        return self.create_result
+
+    async def get_by_id(self, position_id):
+        self.get_by_id_calls.append(position_id)
+        return self.get_by_id_result
+
+    async def get_all(self):
+        self.get_all_calls += 1
+        return self.get_all_result
+
+    async def iter_all(self):
+        for position in self.get_all_result:
+            yield position
+
+
+class StubAuthRepo:
+    """Auth repository stub returning preset results and recording calls"""
+
+    def __init__(self):
+        self.verify_user_result = False
+        self.create_user_result = False
+        self.create_user_calls = []
+
+    async def verify_user(self, username, password):
+        return self.verify_user_result
+
+    async def create_user(self, username, password):
+        self.create_user_calls.append((username, password))
+        return self.create_user_result
+
 
 class TestEmployeeUseCase:
     """Test Employee use case"""
 
     @pytest.fixture
     def employee_repo(self):
-        return AsyncMock()
+        return StubEmployeeRepo()
 
     @pytest.fixture
     def position_repo(self):
-        return AsyncMock()
+        return StubPositionRepo()
 
     @pytest.fixture
     def employee_use_case(self, employee_repo, position_repo):
         return EmployeeUseCase(employee_repo, position_repo)
 
-    @pytest.mark.asyncio
     async def test_create_employee_success(self, employee_use_case, employee_repo, position_repo):
         """Test successful employee creation"""
         # Arrange
-        position_id = uuid4()
+        position_id = POS_ID_A
         position = Position(position_id=position_id, position_name="Developer")
-        position_repo.get_by_id.return_value = position
+        position_repo.get_by_id_result = position
         
-        created_employee = Employee(emp_id=uuid4(), name="John Doe", position_id=position_id)
-        employee_repo.create.return_value = created_employee
+        created_employee = Employee(emp_id=EMP_ID_A, name="John Doe", position_id=position_id)
+        employee_repo.create_result = created_employee
         
         dto = EmployeeCreateDTO(name="John Doe", position_id=position_id)
         
@@ -49,32 +123,31 @@ class TestEmployeeUseCase:
         assert result.name == "John Doe"
         assert result.position_id == position_id
         assert result.position_name == "Developer"
-        position_repo.get_by_id.assert_called_once_with(position_id)
-        employee_repo.create.assert_called_once()
+        assert position_repo.get_by_id_calls == [position_id]
+        assert len(employee_repo.create_calls) == 1
 
-    @pytest.mark.asyncio
     async def test_create_employee_position_not_found(self, employee_use_case, position_repo):
         """Test employee creation with non-existent position"""
         # Arrange
         position_id = uuid4()
-        position_repo.get_by_id.return_value = None
+        position_repo.get_by_id_result = None
         dto = EmployeeCreateDTO(name="John Doe", position_id=position_id)
         
         # Act & Assert
         with pytest.raises(ValueError, match="Position not found"):
             await employee_use_case.create_employee(dto)
 
-    @pytest.mark.asyncio
     async def test_get_employee_success(self, employee_use_case, employee_repo, position_repo):
         """Test successful employee retrieval"""
         # Arrange
-        emp_id = uuid4()
-        position_id = uuid4()
-        employee = Employee(emp_id=emp_id, name="John Doe", position_id=position_id)
+        emp_id = EMP_ID_A
+        position_id = POS_ID_A
         position = Position(position_id=position_id, position_name="Developer")
+        employee = Employee(
+            emp_id=emp_id, name="John Doe", position_id=position_id, position=position
+        )
         
-        employee_repo.get_by_id.return_value = employee
-        position_repo.get_by_id.return_value = position
+        employee_repo.get_with_position_result = employee
         
         # Act
         result = await employee_use_case.get_employee(emp_id)
@@ -84,13 +157,13 @@ class TestEmployeeUseCase:
         assert result.emp_id == emp_id
         assert result.name == "John Doe"
         assert result.position_name == "Developer"
+        assert position_repo.get_by_id_calls == []
 
-    @pytest.mark.asyncio
     async def test_get_employee_not_found(self, employee_use_case, employee_repo):
         """Test employee retrieval when not found"""
         # Arrange
         emp_id = uuid4()
-        employee_repo.get_by_id.return_value = None
+        employee_repo.get_with_position_result = None
         
         # Act
         result = await employee_use_case.get_employee(emp_id)
@@ -98,24 +171,65 @@ class TestEmployeeUseCase:
         # Assert
         assert result is None
 
+    async def test_get_all_employees_uses_joined_positions(
+        self, employee_use_case, employee_repo, position_repo
+    ):
+        """Test that listing employees does not look up positions per row"""
+        # Arrange
+        position_id = POS_ID_A
+        position = Position(position_id=position_id, position_name="Developer")
+        employee_repo.get_all_with_positions_result = [
+            Employee(emp_id=EMP_ID_A, name="John Doe", position_id=position_id, position=position),
+            Employee(emp_id=EMP_ID_B, name="Jane Doe", position_id=position_id, position=position),
+            Employee(emp_id=EMP_ID_C, name="Orphan", position_id=POS_ID_B),
+        ]
+
+        # Act
+        result = await employee_use_case.get_all_employees()
+
+        # Assert
+        assert [e.position_name for e in result] == ["Developer", "Developer", None]
+        assert position_repo.get_all_calls == 0
+        assert position_repo.get_by_id_calls == []
+
+    async def test_update_employee_position(self, employee_use_case, employee_repo, position_repo):
+        """Test that updating an employee reports the new position name"""
+        # Arrange
+        emp_id = EMP_ID_A
+        old_position = Position(position_id=POS_ID_A, position_name="Developer")
+        new_position = Position(position_id=POS_ID_B, position_name="Manager")
+        employee_repo.get_with_position_result = Employee(
+            emp_id=emp_id, name="John Doe", position_id=old_position.position_id, position=old_position
+        )
+        position_repo.get_by_id_result = new_position
+        dto = EmployeeUpdateDTO(position_id=new_position.position_id)
+
+        # Act
+        result = await employee_use_case.update_employee(emp_id, dto)
+
+        # Assert
+        assert result.name == "John Doe"
+        assert result.position_id == new_position.position_id
+        assert result.position_name == "Manager"
+        assert position_repo.get_by_id_calls == [new_position.position_id]
+
 
 class TestPositionUseCase:
     """Test Position use case"""
 
     @pytest.fixture
     def position_repo(self):
-        return AsyncMock()
+        return StubPositionRepo()
 
     @pytest.fixture
     def position_use_case(self, position_repo):
         return PositionUseCase(position_repo)
 
-    @pytest.mark.asyncio
     async def test_create_position_success(self, position_use_case, position_repo):
         """Test successful position creation"""
         # Arrange
-        created_position = Position(position_id=uuid4(), position_name="Developer")
-        position_repo.create.return_value = created_position
+        created_position = Position(position_id=POS_ID_A, position_name="Developer")
+        position_repo.create_result = created_position
         
         dto = PositionCreateDTO(position_name="Developer")
         
@@ -124,15 +238,14 @@ class TestPositionUseCase:
         
         # Assert
         assert result.position_name == "Developer"
-        position_repo.create.assert_called_once()
+        assert len(position_repo.create_calls) == 1
 
-    @pytest.mark.asyncio
     async def test_get_position_success(self, position_use_case, position_repo):
         """Test successful position retrieval"""
         # Arrange
-        position_id = uuid4()
+        position_id = POS_ID_A
         position = Position(position_id=position_id, position_name="Developer")
-        position_repo.get_by_id.return_value = position
+        position_repo.get_by_id_result = position
         
         # Act
         result = await position_use_case.get_position(position_id)
@@ -142,15 +255,48 @@ class TestPositionUseCase:
         assert result.position_id == position_id
         assert result.position_name == "Developer"
 
+    async def test_get_all_positions(self, position_use_case, position_repo):
+        """Test listing positions"""
+        # Arrange
+        positions = [
+            Position(position_id=POS_ID_A, position_name="Developer"),
+            Position(position_id=POS_ID_B, position_name="Manager"),
+        ]
+        position_repo.get_all_result = positions
+
+        # Act
+        result = await position_use_case.get_all_positions()
+
+        # Assert
+        assert all(isinstance(p, PositionResponseDTO) for p in result)
+        assert [p.position_id for p in result] == [p.position_id for p in positions]
+        assert [p.position_name for p in result] == ["Developer", "Manager"]
+
+    async def test_iter_all_positions(self, position_use_case, position_repo):
+        """Test streaming positions as response DTOs"""
+        # Arrange
+        positions = [
+            Position(position_id=POS_ID_A, position_name="Developer"),
+            Position(position_id=POS_ID_B, position_name="Manager"),
+        ]
+        position_repo.get_all_result = positions
+
+        # Act
+        result = [p async for p in position_use_case.iter_all_positions()]
+
+        # Assert
+        assert all(isinstance(p, PositionResponseDTO) for p in result)
+        assert [p.position_name for p in result] == ["Developer", "Manager"]
+
 
 class TestAuthUseCase:
     """Test Auth use case"""
 
     @pytest.fixture
     def auth_repo(self):
-        return AsyncMock()
+        return StubAuthRepo()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def jwt_service(self):
         mock = MagicMock()
         mock.create_access_token.return_value = "test_token"
@@ -160,11 +306,10 @@ class TestAuthUseCase:
     def auth_use_case(self, auth_repo, jwt_service):
         return AuthUseCase(auth_repo, jwt_service)
 
-    @pytest.mark.asyncio
     async def test_login_success(self, auth_use_case, auth_repo, jwt_service):
         """Test successful login"""
         # Arrange
-        auth_repo.verify_user.return_value = True
+        auth_repo.verify_user_result = True
         dto = LoginDTO(username="testuser", password="password")
         
         # Act
@@ -175,11 +320,10 @@ class TestAuthUseCase:
         assert result.access_token == "test_token"
         assert result.token_type == "bearer"
 
-    @pytest.mark.asyncio
     async def test_login_invalid_credentials(self, auth_use_case, auth_repo):
         """Test login with invalid credentials"""
         # Arrange
-        auth_repo.verify_user.return_value = False
+        auth_repo.verify_user_result = False
         dto = LoginDTO(username="testuser", password="wrongpassword")
         
         # Act
@@ -188,11 +332,10 @@ class TestAuthUseCase:
         # Assert
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_create_user_success(self, auth_use_case, auth_repo):
         """Test successful user creation"""
         # Arrange
-        auth_repo.create_user.return_value = True
+        auth_repo.create_user_result = True
         dto = UserCreateDTO(username="newuser", password="password")
         
         # Act
@@ -200,4 +343,4 @@ class TestAuthUseCase:
         
         # Assert
         assert result is True
-        auth_repo.create_user.assert_called_once_with("newuser", "password")
\ No newline at end of file
+        assert auth_repo.create_user_calls == [("newuser", "password")]
\ No newline at end of file